@@ -21,7 +21,6 @@ Dependencies:
     Python Packages:
         - pynput: Global hotkey listening across all applications
         - sounddevice: Cross-platform audio capture from default input device
-        - scipy: WAV file encoding for audio transmission
         - python-socketio: WebSocket client for real-time server communication
         - pyperclip: Clipboard operations for text insertion
         - pyautogui: Cross-platform GUI automation for paste simulation
@@ -59,22 +58,24 @@ env_path = Path(__file__).parent.parent / ".env"
 if env_path.exists():
     load_dotenv(env_path)
     print(f"[Config] Loaded environment from {env_path}")
+import random
+import re
 import time
-import base64
-import io
+import struct
 import threading
 import queue
+import socket
+from collections import deque
 from typing import Optional
 from dataclasses import dataclass
+from functools import lru_cache
 
 # Audio processing
 import numpy as np
 import sounddevice as sd
-from scipy.io import wavfile
 
 # System interaction
 import pyperclip
-import pyautogui
 
 # Global hotkey
 from pynput import keyboard
@@ -82,6 +83,15 @@ from pynput import keyboard
 # WebSocket client
 import socketio
 
+# Base64 for the legacy one-shot audio upload. pybase64 is a drop-in
+# replacement backed by libbase64's SIMD kernels (~4-8x faster) that
+# releases the GIL while encoding, so a multi-MB encode can't stall the
+# capture reader thread. Optional; stdlib base64 works fine too.
+try:
+    import pybase64 as base64
+except ImportError:
+    import base64
+
 # Visual feedback overlay
 from recording_overlay import RecordingOverlay
 
@@ -125,6 +135,12 @@ class Config:
             WebSocket connection and detect network issues.
         paste_cooldown: Minimum seconds between paste operations to
             prevent accidental rapid-fire text insertion.
+        restore_clipboard: When True, the agent saves the user's
+            clipboard before pasting and restores it afterwards. Off by
+            default: applications read the clipboard only when they
+            process the paste from their input queue, so an early
+            restore can make them paste the old contents instead of
+            the dictation.
 
     Example:
         >>> config = Config()
@@ -147,10 +163,185 @@ class Config:
     processing_mode: str = os.getenv("PROCESSING_MODE", "networked-local")  # cloud, networked-local, local
     heartbeat_interval: int = 5
     paste_cooldown: float = 0.1
+    restore_clipboard: bool = os.getenv("LOCALFLOW_RESTORE_CLIPBOARD", "").lower() in (
+        "1",
+        "true",
+        "yes",
+    )
 
 
 CONFIG = Config()
 
+# Maximum recording length in seconds. The AudioRecorder preallocates a
+# single int16 buffer of this capacity so the capture path never
+# allocates; 5 minutes at 16kHz mono is ~9.6MB.
+MAX_RECORD_SECONDS = 300
+
+# Frames per blocking read from the input stream; 2048 frames at 16kHz
+# is 128ms, which bounds how long stop() waits for the reader thread.
+READ_BLOCKSIZE = 2048
+
+# How often the streaming thread flushes newly captured PCM to the
+# server while recording. 100ms keeps per-chunk overhead low while the
+# server sees audio almost as soon as it is spoken.
+STREAM_CHUNK_INTERVAL = 0.1
+
+# Trailing-silence trim: blocks whose mean absolute amplitude falls
+# below SILENCE_MEAN_ABS count as silence, and everything after the
+# last voiced block (plus a short tail so word endings are never
+# clipped) is dropped from the one-shot upload. A hotkey held a beat
+# too long then stops costing network bytes and server decode time.
+SILENCE_MEAN_ABS = 120
+SILENCE_TAIL_SECONDS = 0.2
+
+# Recordings shorter than this are accidental hotkey taps: too short to
+# contain a word, not worth a network round trip or a server decode.
+MIN_RECORDING_SECONDS = 0.15
+
+# How long after the paste chord before the user's prior clipboard is
+# restored (only when LOCALFLOW_RESTORE_CLIPBOARD is enabled). The
+# target app reads the clipboard when it processes the chord from its
+# input queue, which under load is well after the chord is posted;
+# restoring too early makes it paste the old contents.
+CLIPBOARD_RESTORE_DELAY = 1.0
+
+# Separator line for the startup banner.
+_BANNER = "=" * 60
+
+# Case-insensitive Windows Terminal title matcher, compiled once.
+# Avoids allocating a lowercase copy of potentially long window titles
+# on every foreground-window change.
+_WT_TITLE_RE = re.compile(r"windows terminal", re.IGNORECASE)
+
+
+# Virtual key codes for modifier keys; used to split a parsed hotkey
+# into its modifier and trigger components.
+_MODIFIER_VKS = frozenset({160, 161, 162, 163, 164, 165})
+
+# The Alt-variant vk codes the listener tracks as chord modifiers.
+# Only Alt-based hotkeys are supported (see CLAUDE.md / README).
+_ALT_VKS = frozenset({164, 165})  # Left Alt, Right Alt/AltGr
+
+# Win32 low-level keyboard hook message ids, as seen by pynput's
+# win32_event_filter. Keys pressed while Alt is held arrive as the
+# WM_SYS* variants.
+_WM_KEYDOWNS = frozenset({0x0100, 0x0104})  # WM_KEYDOWN, WM_SYSKEYDOWN
+_WM_KEYUPS = frozenset({0x0101, 0x0105})  # WM_KEYUP, WM_SYSKEYUP
+
+# pynput special-key -> virtual key code map used on every keyboard
+# event. Built once at import time so the listener callback never
+# allocates; the callback runs on the OS input hook thread where any
+# extra work shows up as system-wide keyboard lag.
+_SPECIAL_KEY_VKS = {
+    keyboard.Key.alt_l: 164,
+    keyboard.Key.alt_r: 165,
+    keyboard.Key.alt_gr: 165,  # AltGr reports as right alt
+    keyboard.Key.alt: 164,  # Default to left alt
+    keyboard.Key.ctrl_l: 162,
+    keyboard.Key.ctrl_r: 163,
+    keyboard.Key.ctrl: 162,
+    keyboard.Key.shift: 160,
+    keyboard.Key.shift_l: 160,
+    keyboard.Key.shift_r: 161,
+}
+
+
+@lru_cache(maxsize=16)
+def _parse_hotkey(hotkey_str: str) -> frozenset:
+    """Parse a hotkey string into a frozenset of virtual key codes.
+
+    Converts human-readable hotkey strings like "alt+z" into sets of
+    Windows virtual key codes (VK codes) used for low-level keyboard
+    event matching. Supports modifier keys (alt, ctrl, shift) and
+    special characters. Results are memoized per unique string - a
+    given hotkey is parsed once per process, no matter how many
+    settings_update events repeat it.
+
+    Key Technologies/APIs:
+        - functools.lru_cache: Memoization keyed by the hotkey string
+        - ord(): Character to ASCII/Unicode code point conversion
+        - Windows VK codes: Virtual key code constants (164=Alt,
+          162=Ctrl, 160=Shift, 191=OEM_2)
+
+    Args:
+        hotkey_str: Hotkey combination string like "alt+z",
+            "ctrl+shift+f", or "alt+/". Case insensitive.
+
+    Returns:
+        frozenset: Immutable set of integer virtual key codes
+            representing the parsed hotkey combination.
+
+    Example:
+        >>> sorted(_parse_hotkey("alt+z"))
+        [90, 164]
+    """
+    parts = hotkey_str.lower().replace("+", " ").split()
+    vk_codes = set()
+
+    # Virtual key codes for modifier keys
+    vk_map = {
+        "alt": 164,  # VK_LMENU (left alt)
+        "ctrl": 162,  # VK_LCONTROL
+        "control": 162,
+        "shift": 160,  # VK_LSHIFT
+    }
+
+    # Special keys with VK codes different from ASCII
+    special_keys = {
+        "/": 191,  # VK_OEM_2 (/ ? key)
+        "?": 191,  # Same key, shifted
+    }
+
+    for part in parts:
+        if part in vk_map:
+            vk_codes.add(vk_map[part])
+        elif part in special_keys:
+            vk_codes.add(special_keys[part])
+        elif len(part) == 1:
+            # For regular characters, use ord() to get the virtual key code
+            vk_codes.add(ord(part.upper()))
+
+    log_debug(f"Parsed hotkey '{hotkey_str}' -> vk_codes: {vk_codes}")
+    return frozenset(vk_codes)
+
+
+def _wav_header(n_samples: int, sample_rate: int = 16000, channels: int = 1) -> bytes:
+    """Build a 44-byte RIFF/WAVE header for 16-bit PCM data.
+
+    A WAV file is just this fixed-layout header followed by raw PCM, so
+    synthesizing it directly lets encode_wav() produce the file with a
+    single header+payload concatenation instead of routing every sample
+    through scipy's chunked writer and a BytesIO copy.
+
+    Key Technologies/APIs:
+        - struct.pack: Little-endian binary layout of the RIFF header
+
+    Args:
+        n_samples: Number of audio frames in the payload.
+        sample_rate: Sample rate in Hz. Defaults to Whisper's 16000.
+        channels: Number of channels. Defaults to mono.
+
+    Returns:
+        bytes: The 44-byte header to prepend to the PCM payload.
+    """
+    data_len = n_samples * channels * 2  # 16-bit samples
+    return struct.pack(
+        "<4sI4s4sIHHIIHH4sI",
+        b"RIFF",
+        36 + data_len,
+        b"WAVE",
+        b"fmt ",
+        16,  # fmt chunk size
+        1,  # PCM format
+        channels,
+        sample_rate,
+        sample_rate * channels * 2,  # byte rate
+        channels * 2,  # block align
+        16,  # bits per sample
+        b"data",
+        data_len,
+    )
+
 
 # ============================================
 # LOGGING
@@ -236,31 +427,45 @@ def log_error(message: str) -> None:
     log("ERROR", message)
 
 
-def log_debug(message: str) -> None:
+# Sampled once at import: the DEBUG environment variable cannot change
+# mid-run, and checking a module global is cheaper than a getenv call
+# on every log_debug invocation.
+_DEBUG_ENABLED = bool(os.getenv("DEBUG"))
+
+
+def log_debug(message: str, *args) -> None:
     """Log a debug message (only when DEBUG environment variable is set).
 
     A conditional logging function that only outputs when the DEBUG
     environment variable is present. This allows verbose internal state
     logging without cluttering normal operation output.
 
+    Callers on hot paths should pass %-style format arguments rather
+    than pre-building an f-string, so the interpolation (and any
+    slicing of large values) only happens when debug output is enabled.
+
     Key Technologies/APIs:
-        - os.getenv: Checks for DEBUG environment variable presence
+        - Module-level _DEBUG_ENABLED flag sampled at import
+        - %-formatting deferred until output is known to be wanted
         - Delegates to log() function with level="DEBUG" when enabled
 
     Args:
-        message: Debug information for development troubleshooting.
-            Can be verbose as it won't display in production.
+        message: Debug information for development troubleshooting,
+            optionally with %-style placeholders. Can be verbose as it
+            won't display in production.
+        *args: Values interpolated into message only when debug
+            logging is enabled.
 
     Returns:
         None: Output only printed if DEBUG environment variable exists.
 
     Example:
         >>> os.environ["DEBUG"] = "1"
-        >>> log_debug("Audio buffer size: 1024 bytes")
+        >>> log_debug("Audio buffer size: %d bytes", 1024)
         [2024-01-15 10:30:00] [DEBUG] Audio buffer size: 1024 bytes
     """
-    if os.getenv("DEBUG"):
-        log("DEBUG", message)
+    if _DEBUG_ENABLED:
+        log("DEBUG", message % args if args else message)
 
 
 def log_warning(message: str) -> None:
@@ -296,28 +501,33 @@ class AudioRecorder:
 
     This class manages the complete audio recording lifecycle including
     stream initialization, buffer management, and WAV encoding. It uses
-    a callback-based architecture with sounddevice for efficient real-time
-    audio capture without blocking the main thread.
+    a blocking-read architecture: a dedicated daemon thread loops on
+    RawInputStream.read(), which blocks inside PortAudio's C code with
+    the GIL released, so capture never stalls when the main thread is
+    busy with socket emits, Tk overlay painting, or garbage collection.
 
     The recorder implements a push-to-talk pattern where recording only
     occurs while explicitly enabled, allowing users to control exactly
     when audio is captured via hotkey hold duration.
 
+    Samples are written into a single preallocated int16 buffer sized
+    for MAX_RECORD_SECONDS. The reader thread does nothing but a slice
+    assignment and an index increment - no allocation, no locking -
+    while PortAudio manages its own internal ring buffer on the
+    realtime thread with zero Python involvement. stop() simply slices
+    the buffer up to the write index.
+
     Key Technologies/APIs:
-        - sounddevice.InputStream: Real-time audio input with callback
-          architecture for non-blocking capture
-        - numpy.concatenate: Efficient buffer concatenation for audio
-          chunks collected during recording
-        - scipy.io.wavfile.write: In-memory WAV encoding without
-          temporary files using BytesIO
-        - threading.Lock: Thread-safe access to audio buffer from
-          callback thread and main thread
+        - sounddevice.RawInputStream: Blocking-read audio input; read()
+          releases the GIL while waiting in C
+        - numpy.empty: One-time preallocation of the recording buffer
+        - numpy.frombuffer: Zero-copy view over each read block
+        - _wav_header + ndarray.tobytes: In-memory WAV encoding without
+          temporary files
 
     Attributes:
         recording: Boolean indicating if currently capturing audio.
-        audio_data: List of numpy arrays containing recorded chunks.
-        stream: The sounddevice InputStream instance when active.
-        lock: Threading lock for safe buffer access.
+        stream: The sounddevice RawInputStream instance when active.
 
     Example:
         >>> recorder = AudioRecorder()
@@ -332,71 +542,83 @@ class AudioRecorder:
     def __init__(self) -> None:
         """Initialize the AudioRecorder with default state.
 
-        Sets up the initial state with empty audio buffers and no active
+        Sets up the initial state with no recording buffer and no active
         stream. The recorder starts in a non-recording state and requires
-        an explicit start() call to begin capture.
-
-        Key Technologies/APIs:
-            - threading.Lock initialization for thread-safe state management
+        an explicit start() call to begin capture. The recording buffer
+        is allocated lazily on the first start() and reused across
+        sessions to avoid per-recording allocation.
 
         Returns:
             None
         """
         self.recording = False
-        self.audio_data: list = []
-        self.stream: Optional[sd.InputStream] = None
-        self.lock = threading.Lock()
-
-    def _audio_callback(self, indata, frames, time_info, status) -> None:
-        """SoundDevice callback function for incoming audio data.
-
-        This callback is invoked by the sounddevice library on a separate
-        thread whenever new audio data is available from the input device.
-        It captures audio chunks into the buffer only when recording is
-        active, effectively implementing push-to-talk behavior.
+        self.stream: Optional[sd.RawInputStream] = None
+        self._buf: Optional[np.ndarray] = None
+        self._write_idx = 0
+        self._last_voice_idx = 0
+        self._overflowed = False
+        self._reader_thread: Optional[threading.Thread] = None
+
+    def _reader_loop(self) -> None:
+        """Blocking read loop that drains the stream into the buffer.
+
+        Runs in a dedicated daemon thread for the duration of a
+        recording session. Each iteration blocks in RawInputStream.read()
+        - which waits inside PortAudio's C code with the GIL released -
+        then copies the returned block into the preallocated buffer via
+        a zero-copy numpy view. PortAudio's internal ring buffer absorbs
+        any scheduling jitter on this thread, so no frames are dropped
+        even if Python is briefly stalled by GC or other threads.
 
         Key Technologies/APIs:
-            - sounddevice InputStream callback: Real-time audio capture
-              callback signature (indata, frames, time_info, status)
-            - threading.Lock.acquire/release: Thread-safe buffer access
-              between callback thread and main thread
-            - numpy.ndarray.copy: Deep copy to prevent data corruption
-
-        Args:
-            indata: numpy.ndarray containing the audio samples with shape
-                (frames, channels) and dtype from stream configuration.
-            frames: Number of frames (samples) in this callback invocation.
-            time_info: Dictionary with timing information including
-                'input_buffer_adc_time', 'current_time', 'output_buffer_dac_time'.
-            status: CallbackFlags indicating any stream status issues like
-                buffer overruns/underruns.
+            - RawInputStream.read: Blocking C-level read, GIL released
+            - numpy.frombuffer: Zero-copy int16 view over the raw block
+            - numpy slice assignment: Copy into the preallocated buffer
 
         Returns:
-            None: Audio data is appended to self.audio_data buffer.
-
-        Note:
-            This method runs on a separate audio thread managed by
-            sounddevice/portaudio, not the main Python thread.
+            None: Exits when recording is cleared or the buffer is full.
         """
-        if status:
-            log_error(f"Audio status: {status}")
-
-        if self.recording:
-            with self.lock:
-                self.audio_data.append(indata.copy())
+        overflow_seen = False
+        while self.recording:
+            try:
+                data, overflowed = self.stream.read(READ_BLOCKSIZE)
+            except Exception:
+                # Stream was stopped/closed out from under us during
+                # shutdown; treat as end of recording.
+                break
+
+            overflow_seen = overflow_seen or overflowed
+
+            block = np.frombuffer(data, dtype=np.int16).reshape(-1, CONFIG.channels)
+            idx = self._write_idx
+            n = len(block)
+            if idx + n > len(self._buf):
+                # Buffer full (MAX_RECORD_SECONDS exceeded); drop the rest.
+                self._overflowed = True
+                break
+            self._buf[idx : idx + n] = block
+            self._write_idx = idx + n
+            # One numpy reduction per ~128ms block; tracks where speech
+            # last occurred so stop() can trim trailing silence.
+            if np.abs(block).mean() >= SILENCE_MEAN_ABS:
+                self._last_voice_idx = idx + n
+
+        if overflow_seen:
+            log_warning("Audio input overflowed during recording")
 
     def start(self) -> bool:
         """Begin audio recording from the default input device.
 
-        Initializes and starts the sounddevice InputStream with configured
-        parameters (sample_rate, channels, dtype). The stream runs in
-        callback mode, capturing audio chunks to the internal buffer
-        until stop() is called.
+        Initializes and starts a sounddevice RawInputStream with
+        configured parameters (sample_rate, channels, dtype) and spawns
+        the blocking reader thread, which drains audio into the internal
+        buffer until stop() is called.
 
         Key Technologies/APIs:
-            - sounddevice.InputStream: Audio input stream initialization
-              with samplerate, channels, dtype, callback parameters
-            - InputStream.start(): Begin audio capture
+            - sounddevice.RawInputStream: Audio input stream for blocking
+              reads; 'high' latency gives PortAudio a generous internal
+              ring buffer to absorb jitter
+            - threading.Thread: Daemon reader thread running _reader_loop
             - Exception handling for device unavailable scenarios
 
         Returns:
@@ -417,42 +639,54 @@ class AudioRecorder:
             return False
 
         try:
-            self.audio_data = []
-            self.stream = sd.InputStream(
+            if self._buf is None:
+                self._buf = np.empty(
+                    (CONFIG.sample_rate * MAX_RECORD_SECONDS, CONFIG.channels),
+                    dtype=np.int16,
+                )
+            self._write_idx = 0
+            self._last_voice_idx = 0
+            self._overflowed = False
+            self.stream = sd.RawInputStream(
                 samplerate=CONFIG.sample_rate,
                 channels=CONFIG.channels,
                 dtype=CONFIG.dtype,
-                callback=self._audio_callback,
-                blocksize=1024,
+                blocksize=READ_BLOCKSIZE,
+                latency="high",
             )
             self.stream.start()
             self.recording = True
+            self._reader_thread = threading.Thread(target=self._reader_loop, daemon=True)
+            self._reader_thread.start()
             log_info("Recording started")
             return True
         except Exception as e:
             log_error(f"Failed to start recording: {e}")
             return False
 
-    def stop(self) -> Optional[bytes]:
-        """Stop recording and return the captured audio as WAV bytes.
+    def stop(self, encode_wav: bool = True) -> Optional[bytes]:
+        """Stop recording and optionally return the audio as WAV bytes.
 
-        Halts the audio stream, concatenates all recorded chunks into
-        a continuous audio buffer, and encodes it as a standard WAV
-        file in memory. This method handles the complete teardown of
-        the recording session and returns the final audio data ready
-        for transmission to the server.
+        Halts the audio stream and joins the reader thread. When
+        encode_wav is True (the default, used by the one-shot send
+        path), the recorded samples are encoded as a standard WAV file
+        in memory via encode_wav(). When False (used by the streaming
+        send path, where the server has already received the PCM), only
+        capture teardown is performed.
 
         Key Technologies/APIs:
-            - InputStream.stop()/close(): Clean audio stream shutdown
-            - numpy.concatenate: Efficient joining of audio chunks
-            - scipy.io.wavfile.write: WAV encoding to BytesIO buffer
-            - io.BytesIO: In-memory file-like object for WAV data
+            - RawInputStream.stop()/close(): Clean audio stream shutdown
+            - Thread.join: Bounded wait for the reader thread to drain
+
+        Args:
+            encode_wav: Whether to encode and return the recorded audio
+                as WAV bytes. Pass False when the samples have already
+                been transmitted incrementally.
 
         Returns:
             Optional[bytes]: WAV-encoded audio data as bytes if recording
-                was successful and audio was captured. Returns None if
-                not recording, no audio data was captured, or an error
-                occurred during processing.
+                was successful, audio was captured, and encode_wav is
+                True. Returns None otherwise.
 
         Raises:
             No exceptions are raised; errors are caught and logged.
@@ -472,33 +706,105 @@ class AudioRecorder:
         self.recording = False
 
         try:
+            # Let the reader thread drain its current block and exit
+            # before tearing the stream down (one block = ~128ms max).
+            if self._reader_thread:
+                self._reader_thread.join(timeout=0.5)
+                self._reader_thread = None
+
             if self.stream:
                 self.stream.stop()
                 self.stream.close()
                 self.stream = None
 
-            with self.lock:
-                if not self.audio_data:
-                    log_error("No audio data recorded")
-                    return None
+            if self._overflowed:
+                log_warning(f"Recording exceeded {MAX_RECORD_SECONDS}s cap; trailing audio dropped")
+
+            # Drop trailing silence (keeping a short tail) so a hotkey
+            # released late never ships seconds of dead air. Clamping
+            # the write index makes every consumer - encode_wav, the
+            # PCM fallback, frames_recorded - see the trimmed length.
+            # Only trim when at least one voiced block was seen: with a
+            # quiet mic that never crosses SILENCE_MEAN_ABS, the whole
+            # recording would otherwise be clamped to the 0.2s tail.
+            # "Never voiced" means the threshold can't classify this
+            # recording, not that it's all silence - ship it intact and
+            # let Whisper decide.
+            voiced_end = self._last_voice_idx + int(
+                SILENCE_TAIL_SECONDS * CONFIG.sample_rate
+            )
+            if self._last_voice_idx and voiced_end < self._write_idx:
+                log_debug(
+                    "Trimmed %.1fs of trailing silence",
+                    (self._write_idx - voiced_end) / CONFIG.sample_rate,
+                )
+                self._write_idx = voiced_end
+
+            duration = self._write_idx / CONFIG.sample_rate
+            log_info(f"Recording stopped: {duration:.1f}s")
+
+            if encode_wav:
+                return self.encode_wav()
+            return None
 
-                # Concatenate all audio chunks
-                audio = np.concatenate(self.audio_data, axis=0)
+        except Exception as e:
+            log_error(f"Failed to stop recording: {e}")
+            return None
 
-                # Convert to WAV format in memory
-                buffer = io.BytesIO()
-                wavfile.write(buffer, CONFIG.sample_rate, audio)
-                wav_bytes = buffer.getvalue()
+    def encode_wav(self) -> Optional[bytes]:
+        """Encode the recorded samples as an in-memory WAV file.
 
-                duration = len(audio) / CONFIG.sample_rate
-                log_info(f"Recording stopped: {duration:.1f}s, {len(wav_bytes)} bytes")
+        Slices the preallocated buffer up to the write index and
+        encodes it as a standard 16-bit PCM WAV file. Used by the
+        one-shot send path, and as a fallback when incremental
+        streaming fails mid-recording.
 
-                return wav_bytes
+        Key Technologies/APIs:
+            - numpy slicing: Zero-copy view of the recorded samples
+            - _wav_header: Hand-built 44-byte RIFF header, so the only
+              full-buffer copy is the single tobytes() of the samples
 
-        except Exception as e:
-            log_error(f"Failed to stop recording: {e}")
+        Returns:
+            Optional[bytes]: WAV-encoded audio data, or None if no
+                audio was captured.
+        """
+        if self._write_idx == 0:
+            log_error("No audio data recorded")
             return None
 
+        # Slice the preallocated buffer (view, no copy)
+        audio = self._buf[: self._write_idx]
+
+        return _wav_header(len(audio), CONFIG.sample_rate, CONFIG.channels) + audio.tobytes()
+
+    def frames_recorded(self) -> int:
+        """Return the number of frames captured so far.
+
+        Safe to call from any thread while recording; the write index
+        only ever grows, so a reader sees a consistent prefix of the
+        buffer.
+
+        Returns:
+            int: Count of frames written to the recording buffer.
+        """
+        return self._write_idx
+
+    def read_pcm(self, start: int, end: int) -> bytes:
+        """Return raw PCM bytes for a frame range of the recording.
+
+        Used by the streaming send path to flush newly captured samples
+        to the server without re-encoding the whole recording.
+
+        Args:
+            start: First frame index (inclusive).
+            end: Last frame index (exclusive). Must not exceed
+                frames_recorded().
+
+        Returns:
+            bytes: Little-endian int16 PCM for the requested range.
+        """
+        return self._buf[start:end].tobytes()
+
     def is_recording(self) -> bool:
         """Check if the recorder is currently capturing audio.
 
@@ -544,13 +850,14 @@ class PasteHandler:
 
     Key Technologies/APIs:
         - pyperclip.copy: Cross-platform clipboard text setting
-        - pyautogui.hotkey: Simulated keyboard shortcuts for paste
+        - pynput.keyboard.Controller: Direct OS key events for the
+          paste chord, without pyautogui's failsafe and screen-size
+          bookkeeping on every call
         - pyautogui.getActiveWindow: Window detection for special
           handling of applications like Windows Terminal
         - time.sleep: Synchronization delays for clipboard readiness
 
     Attributes:
-        last_paste_time: Unix timestamp of most recent paste operation.
         agent: Reference to parent LocalFlowAgent for keyboard event
             coordination (prevents hotkey detection during paste).
 
@@ -577,13 +884,355 @@ class PasteHandler:
         Returns:
             None
         """
-        self.last_paste_time = 0
+        # Cooldown bookkeeping in integer monotonic nanoseconds:
+        # immune to wall-clock jumps (NTP, DST) and compares without
+        # float arithmetic.
+        self._last_paste_ns = 0
+        self._cooldown_ns = int(CONFIG.paste_cooldown * 1_000_000_000)
         self.agent = agent  # Reference to agent for keyboard flag
+        # Platform facts don't change at runtime; resolve them once
+        # instead of string-comparing sys.platform on every paste.
+        self._is_macos = sys.platform == "darwin"
+        self._is_windows = sys.platform == "win32"
+        self._paste_mod = keyboard.Key.cmd if self._is_macos else keyboard.Key.ctrl
+        self._kb = keyboard.Controller()
+        # On Windows, GetClipboardSequenceNumber is a single cheap
+        # user32 call that increments on every clipboard change -
+        # polling it beats reading the clipboard contents back each
+        # iteration. Resolve the function pointer once here.
+        self._get_clip_seq = None
+        self._user32 = None
+        self._kernel32 = None
+        if self._is_windows:
+            try:
+                import ctypes
+
+                self._user32 = ctypes.windll.user32
+                self._kernel32 = ctypes.windll.kernel32
+                self._get_clip_seq = self._user32.GetClipboardSequenceNumber
+                # ctypes defaults every return type to c_int, which
+                # truncates the 64-bit HGLOBAL/pointer values from
+                # GlobalAlloc/GlobalLock on x64 - memmove through a
+                # truncated pointer is an access violation. Declare the
+                # prototypes once so handles round-trip intact.
+                self._kernel32.GlobalAlloc.restype = ctypes.c_void_p
+                self._kernel32.GlobalAlloc.argtypes = (ctypes.c_uint, ctypes.c_size_t)
+                self._kernel32.GlobalLock.restype = ctypes.c_void_p
+                self._kernel32.GlobalLock.argtypes = (ctypes.c_void_p,)
+                self._kernel32.GlobalUnlock.argtypes = (ctypes.c_void_p,)
+                self._kernel32.GlobalFree.restype = ctypes.c_void_p
+                self._kernel32.GlobalFree.argtypes = (ctypes.c_void_p,)
+                self._user32.SetClipboardData.restype = ctypes.c_void_p
+                self._user32.SetClipboardData.argtypes = (ctypes.c_uint, ctypes.c_void_p)
+            except (ImportError, AttributeError, OSError):
+                pass
+        # Last text we placed on the clipboard and the sequence number
+        # observed right after - lets identical re-pastes (dictation
+        # retries) skip the copy and settle wait entirely.
+        self._last_copied_text: Optional[str] = None
+        self._last_copied_seq: Optional[int] = None
+        # Foreground-window paste-strategy cache: hwnd -> needs Alt+V.
+        # Window handles are stable for the life of a window, so the
+        # title fetch runs once per distinct window, not once per paste.
+        self._fg_cache: dict = {}
+        # Pastes run on a dedicated worker thread so the socket handler
+        # that receives dictation results never blocks on clipboard
+        # settling, cooldowns, or a hung clipboard viewer. A None item
+        # is the shutdown sentinel.
+        self._q: queue.SimpleQueue = queue.SimpleQueue()
+        self._worker = threading.Thread(target=self._worker_loop, daemon=True)
+        self._worker.start()
+
+    def _worker_loop(self) -> None:
+        """Paste worker consuming queued texts until shutdown.
+
+        Runs for the life of the handler on a daemon thread. Each
+        queued string goes through the full blocking paste sequence
+        (_paste_now); a None sentinel exits the loop.
+
+        Key Technologies/APIs:
+            - queue.SimpleQueue.get: Blocking, allocation-free handoff
+
+        Returns:
+            None
+        """
+        shutdown = False
+        while not shutdown:
+            text = self._q.get()
+            if text is None:
+                break
+            # Coalesce dictations that queued up while a previous paste
+            # was in flight (its cooldown and settle waits are long
+            # enough for rapid dictations to stack) into one clipboard
+            # write and one chord. Only already-queued items are
+            # drained, so a lone paste is never delayed.
+            parts = [text]
+            while True:
+                try:
+                    nxt = self._q.get_nowait()
+                except queue.Empty:
+                    break
+                if nxt is None:
+                    shutdown = True
+                    break
+                parts.append(nxt)
+            self._paste_now(" ".join(parts) if len(parts) > 1 else text)
+
+    def shutdown(self) -> None:
+        """Stop the paste worker thread.
+
+        Enqueues the shutdown sentinel; any pastes already queued are
+        completed first. Safe to call more than once.
+
+        Returns:
+            None
+        """
+        self._q.put(None)
+
+    def _clipboard_seq(self) -> Optional[int]:
+        """Return the Windows clipboard sequence number, if available.
+
+        Returns:
+            Optional[int]: The current sequence number on Windows, or
+                None on other platforms / if user32 is unavailable.
+        """
+        if self._get_clip_seq is None:
+            return None
+        try:
+            return self._get_clip_seq()
+        except OSError:
+            return None
+
+    def _set_clipboard(self, text: str) -> None:
+        """Place text on the system clipboard.
+
+        On Windows this goes straight through the Win32 clipboard API:
+        pyperclip's Windows backend creates a hidden helper window and
+        copies through an intermediate buffer on every call, which
+        costs 5-15ms where the raw OpenClipboard/SetClipboardData
+        sequence takes about a millisecond for a short transcript.
+        Any Win32 failure (clipboard held open by another process,
+        allocation failure) falls back to pyperclip, which is also the
+        path for every other platform.
+
+        Key Technologies/APIs:
+            - user32.OpenClipboard/EmptyClipboard/SetClipboardData:
+              CF_UNICODETEXT clipboard write
+            - kernel32.GlobalAlloc/GlobalLock: Moveable global memory
+              block that the clipboard takes ownership of
+            - pyperclip.copy: Cross-platform fallback
+
+        Args:
+            text: The text to place on the clipboard.
+        """
+        if self._kernel32 is not None:
+            try:
+                import ctypes
+
+                if self._user32.OpenClipboard(0):
+                    try:
+                        self._user32.EmptyClipboard()
+                        data = text.encode("utf-16-le") + b"\x00\x00"
+                        hglb = self._kernel32.GlobalAlloc(0x0002, len(data))  # GMEM_MOVEABLE
+                        if hglb:
+                            ptr = self._kernel32.GlobalLock(hglb)
+                            if ptr:
+                                ctypes.memmove(ptr, data, len(data))
+                                self._kernel32.GlobalUnlock(hglb)
+                                # Clipboard owns hglb after this succeeds
+                                if self._user32.SetClipboardData(13, hglb):  # CF_UNICODETEXT
+                                    return
+                            # Ownership only transfers on success; free
+                            # the block ourselves on any failure.
+                            self._kernel32.GlobalFree(hglb)
+                    finally:
+                        self._user32.CloseClipboard()
+            except (OSError, AttributeError) as e:
+                log_debug(f"Win32 clipboard write failed, falling back: {e}")
+        pyperclip.copy(text)
+
+    def _set_thread_priority(self, priority: int) -> None:
+        """Best-effort priority adjustment for the calling thread.
+
+        Windows only: the copy-to-chord window is sensitive to the
+        worker being scheduled out between setting the clipboard and
+        sending the paste chord, so it briefly runs at
+        THREAD_PRIORITY_ABOVE_NORMAL. A no-op elsewhere (POSIX
+        real-time scheduling needs elevated privileges) and on any
+        Win32 failure.
+
+        Key Technologies/APIs:
+            - kernel32.SetThreadPriority/GetCurrentThread: Pseudo-handle
+              priority adjustment, no handle lifetime to manage
+
+        Args:
+            priority: Win32 thread priority constant (0 = normal,
+                1 = above normal).
+        """
+        if self._kernel32 is None:
+            return
+        try:
+            self._kernel32.SetThreadPriority(
+                self._kernel32.GetCurrentThread(), priority
+            )
+        except OSError:
+            pass
+
+    def _get_clipboard_text(self) -> Optional[str]:
+        """Read the current clipboard text, if any.
+
+        Used to save the user's clipboard before a paste overwrites it.
+        Runs only on the paste worker thread, where a slow or wedged
+        clipboard owner cannot stall anything else.
+
+        Returns:
+            Optional[str]: The clipboard text, or None if it is empty,
+                non-text, or unreadable.
+        """
+        try:
+            prior = pyperclip.paste()
+        except pyperclip.PyperclipException:
+            return None
+        return prior if isinstance(prior, str) and prior else None
+
+    def _clipboard_holds(self, text: str) -> bool:
+        """Check whether the clipboard currently contains this text.
+
+        Used on platforms without a clipboard sequence number to decide
+        if an identical re-paste can skip the copy round-trip.
+
+        Args:
+            text: The candidate text.
+
+        Returns:
+            bool: True if the clipboard readback matches exactly.
+        """
+        try:
+            return pyperclip.paste() == text
+        except pyperclip.PyperclipException:
+            return False
+
+    def _needs_alt_paste(self) -> bool:
+        """Check whether the focused window wants Alt+V instead of Ctrl+V.
+
+        Windows Terminal binds paste to Alt+V, so the agent sniffs the
+        foreground window title before sending the chord. On Windows
+        this goes straight to user32 (GetForegroundWindow +
+        GetWindowTextW) rather than pyautogui.getActiveWindow, which
+        enumerates windows and allocates a pygetwindow wrapper object
+        per call; the verdict is memoized per window handle since
+        handles are stable for a window's lifetime. Other platforms
+        keep the pyautogui fallback (lazily imported).
+
+        Key Technologies/APIs:
+            - user32.GetForegroundWindow/GetWindowTextW: Direct Win32
+              title lookup without wrapper-object allocation
+            - dict memoization keyed on HWND
+
+        Returns:
+            bool: True if the focused window is Windows Terminal.
+        """
+        if self._user32 is not None:
+            try:
+                import ctypes
+
+                hwnd = self._user32.GetForegroundWindow()
+                if not hwnd:
+                    return False
+                cached = self._fg_cache.get(hwnd)
+                if cached is not None:
+                    return cached
+                buf = ctypes.create_unicode_buffer(256)
+                self._user32.GetWindowTextW(hwnd, buf, 256)
+                is_wt = _WT_TITLE_RE.search(buf.value) is not None
+                if len(self._fg_cache) > 64:
+                    # Handles recycle eventually; keep the cache tiny.
+                    self._fg_cache.clear()
+                self._fg_cache[hwnd] = is_wt
+                return is_wt
+            except (OSError, AttributeError):
+                return False
+
+        try:
+            import pyautogui
+
+            active_window = pyautogui.getActiveWindow()
+            window_title = active_window.title if active_window else ""
+            return _WT_TITLE_RE.search(window_title) is not None
+        except Exception as e:
+            # Fall back to the default modifier if detection fails
+            log_debug(f"Active window detection failed: {e}")
+            return False
+
+    def _wait_for_clipboard(self, text: str, seq_before: Optional[int]) -> None:
+        """Block until the clipboard has picked up the copied text.
+
+        Clipboard writes land asynchronously, so pasting immediately
+        after copy can paste stale contents. Rather than a fixed
+        pessimistic sleep, poll until the write is visible: on Windows
+        by watching the clipboard sequence number advance past the
+        pre-copy value (the AutoHotkey ClipWait pattern), elsewhere by
+        reading the clipboard back until it matches. Typically settles
+        in single-digit milliseconds; 200ms is the worst-case cap.
+
+        Key Technologies/APIs:
+            - user32.GetClipboardSequenceNumber: Change detection
+              without reading (or allocating) clipboard contents
+            - pyperclip.paste: Readback fallback on other platforms
+
+        Args:
+            text: The text that was just copied.
+            seq_before: Clipboard sequence number captured before the
+                copy, or None when unavailable (non-Windows).
+        """
+        deadline = time.monotonic() + 0.2
+        if seq_before is not None:
+            while time.monotonic() < deadline:
+                if self._clipboard_seq() != seq_before:
+                    return
+                time.sleep(0.001)
+            return
+        while time.monotonic() < deadline:
+            try:
+                if pyperclip.paste() == text:
+                    return
+            except pyperclip.PyperclipException:
+                # Clipboard briefly locked by another process; retry.
+                pass
+            time.sleep(0.002)
 
     def paste_text(self, text: str) -> bool:
+        """Queue text for insertion at the cursor position.
+
+        Hands the text to the paste worker thread and returns
+        immediately, so callers (the dictation_result socket handler in
+        particular) never block on clipboard settling, cooldown sleeps,
+        or a wedged clipboard viewer. Queued pastes execute in arrival
+        order.
+
+        Key Technologies/APIs:
+            - queue.SimpleQueue.put: Lock-free enqueue to the worker
+
+        Args:
+            text: The transcribed and refined text to insert at the
+                current cursor position. Should be a non-empty string.
+
+        Returns:
+            bool: True always; the paste itself happens asynchronously
+                and failures are logged by the worker.
+
+        Example:
+            >>> handler = PasteHandler()
+            >>> handler.paste_text("This is a test.")
+            True
+        """
+        self._q.put(text)
+        return True
+
+    def _paste_now(self, text: str) -> bool:
         """Copy text to clipboard and simulate paste at cursor position.
 
-        This is the primary method for inserting transcribed text. It:
+        This is the blocking paste sequence, run on the worker thread. It:
         1. Respects the paste cooldown to prevent accidental spam
         2. Sets a flag to disable keyboard listener during paste
         3. Copies the text to the system clipboard via pyperclip
@@ -612,48 +1261,78 @@ class PasteHandler:
         Raises:
             No exceptions are raised; all errors are caught and logged.
 
-        Example:
-            >>> handler = PasteHandler()
-            >>> success = handler.paste_text("This is a test.")
-            >>> print(f"Pasted successfully: {success}")
-            Pasted successfully: True
         """
-        # Respect cooldown
-        now = time.time()
-        if now - self.last_paste_time < CONFIG.paste_cooldown:
-            time.sleep(CONFIG.paste_cooldown)
+        # Respect cooldown - sleep only for the remainder
+        elapsed_ns = time.monotonic_ns() - self._last_paste_ns
+        if elapsed_ns < self._cooldown_ns:
+            time.sleep((self._cooldown_ns - elapsed_ns) / 1e9)
 
         try:
             # Set flag to prevent keyboard listener interference
             if self.agent:
                 self.agent.pasting_in_progress = True
 
-            # Copy to clipboard
-            pyperclip.copy(text)
-            log_debug(f"Copied to clipboard: {text[:50]}...")
-
-            # Longer delay for clipboard to be ready
-            time.sleep(0.2)
-
-            # Simulate paste (auto-detect Windows Terminal)
-            if sys.platform == "darwin":
-                pyautogui.hotkey("command", "v")
+            # Keep the copy->chord window tight: getting scheduled out
+            # between the clipboard write and the paste chord is what
+            # the old pessimistic sleeps defended against.
+            self._set_thread_priority(1)  # THREAD_PRIORITY_ABOVE_NORMAL
+
+            # Copy to clipboard and wait until the write is visible.
+            # If we're re-pasting exactly what we copied last time and
+            # nothing else has touched the clipboard since (sequence
+            # number unchanged on Windows, readback match elsewhere),
+            # skip the round-trip and go straight to the chord.
+            # Clipboard restore is opt-in: save the user's clipboard
+            # only when configured, and skip oversized contents to
+            # avoid a latency spike on the restore write.
+            prior = None
+            if CONFIG.restore_clipboard:
+                prior = self._get_clipboard_text()
+                if prior is not None and len(prior) > 1_000_000:
+                    prior = None
+
+            seq_before = self._clipboard_seq()
+            already_set = text == self._last_copied_text and (
+                seq_before == self._last_copied_seq
+                if seq_before is not None
+                else self._clipboard_holds(text)
+            )
+            if already_set:
+                log_debug("Clipboard already holds this text; skipping copy")
             else:
-                # Detect if Windows Terminal is focused (uses Alt+V)
-                try:
-                    active_window = pyautogui.getActiveWindow()
-                    window_title = active_window.title if active_window else ""
-                    # Windows Terminal typically has "Windows Terminal" in title
-                    is_windows_terminal = "windows terminal" in window_title.lower()
-                    pyautogui.hotkey("alt" if is_windows_terminal else "ctrl", "v")
-                except:
-                    # Fallback to Ctrl+V if window detection fails
-                    pyautogui.hotkey("ctrl", "v")
-
-            # Additional delay to let paste complete
-            time.sleep(0.1)
-
-            self.last_paste_time = now
+                self._set_clipboard(text)
+                log_debug("Copied to clipboard: %.50s...", text)
+                self._wait_for_clipboard(text, seq_before)
+                self._last_copied_text = text
+                self._last_copied_seq = self._clipboard_seq()
+
+            # Simulate paste (auto-detect Windows Terminal, which uses
+            # Alt+V; see _needs_alt_paste for the cached detection)
+            mod = self._paste_mod
+            if not self._is_macos and self._needs_alt_paste():
+                mod = keyboard.Key.alt
+
+            # Send the chord via pynput's Controller - direct OS key
+            # events, no pyautogui failsafe/screen-scale overhead.
+            with self._kb.pressed(mod):
+                self._kb.press("v")
+                self._kb.release("v")
+
+            # Brief delay to let the target app consume the chord before
+            # the keyboard-listener flag clears. Key events are posted
+            # synchronously, so 50ms is ample.
+            time.sleep(0.05)
+
+            # Put the user's clipboard back (opt-in). The chord only
+            # queues the paste; the app reads the clipboard when it
+            # processes the event, so wait CLIPBOARD_RESTORE_DELAY
+            # before rewriting. Invalidates the identical-re-paste
+            # cache via the sequence-number/readback check next paste.
+            if prior is not None and prior != text:
+                time.sleep(CLIPBOARD_RESTORE_DELAY - 0.05)
+                self._set_clipboard(prior)
+
+            self._last_paste_ns = time.monotonic_ns()
             log_info("Text pasted successfully")
             return True
 
@@ -661,6 +1340,7 @@ class PasteHandler:
             log_error(f"Failed to paste: {e}")
             return False
         finally:
+            self._set_thread_priority(0)  # THREAD_PRIORITY_NORMAL
             # Clear flag after paste attempt
             if self.agent:
                 self.agent.pasting_in_progress = False
@@ -737,15 +1417,44 @@ class LocalFlowAgent:
             reconnection=True,
             reconnection_attempts=0,  # Infinite
             reconnection_delay=1,
-            reconnection_delay_max=5,
+            reconnection_delay_max=30,
+            randomization_factor=0.5,  # Jitter so agents don't reconnect in lockstep
         )
+        # Dictations recorded while disconnected are queued here and
+        # drained FIFO on reconnect instead of being silently dropped.
+        self._outbox: deque = deque(maxlen=32)
+        # Overlay updates and informational emits are funneled through
+        # this queue to a single worker thread, so pynput callbacks
+        # (which run on the keyboard hook thread) never touch Tk or the
+        # network directly.
+        self._ui_q: queue.SimpleQueue = queue.SimpleQueue()
+        # Serializes every sio.emit: socketio.Client sends a binary
+        # event as a text header packet plus separate attachment
+        # packets with no internal locking, and the agent emits from
+        # several threads (stream, heartbeat, notify worker, keyboard
+        # hook). An unrelated packet interleaved between a header and
+        # its attachment corrupts the server's binary reconstruction.
+        self._emit_lock = threading.Lock()
         self.connected = False
+        self.connected_evt = threading.Event()  # Set while the socket is up
+        self.server_supports_streaming = False  # Learned from connection_confirmed
+        self._stream_thread: Optional[threading.Thread] = None
+        self._stream_sent = 0  # Frames already flushed to the server
+        self._stream_failed = False  # Set when a chunk emit fails mid-recording
         self.mode = CONFIG.mode
         self.processing_mode = CONFIG.processing_mode
+        # Constant process_audio metadata, rebuilt only when settings
+        # change; per-send payloads are a copy plus the dynamic fields.
+        self._emit_template = {
+            "type": "process_audio",
+            "mode": self.mode,
+            "processingMode": self.processing_mode,
+        }
         self.hotkey = CONFIG.hotkey
         self.format_hotkey = CONFIG.format_hotkey
         self.translate_hotkey = CONFIG.translate_hotkey
         self.running = True
+        self._stop_evt = threading.Event()  # Set on shutdown to wake waiting threads
         self.hotkey_pressed = False
         self.format_mode_active = False  # True when using Alt+M formatting mode
         self.translate_mode_active = False  # True when using Alt+T translation mode
@@ -773,95 +1482,206 @@ class LocalFlowAgent:
             None
 
         Note:
-            Handlers are registered as nested functions to capture self
-            reference and access agent state directly.
+            Handlers are bound methods registered through a dispatch
+            table rather than nested closures: a bound-method call
+            skips the closure cell dereference on every event, and the
+            handlers can be invoked directly in tests without a
+            connected client.
         """
+        handlers = (
+            ("connect", self._on_connect),
+            ("disconnect", self._on_disconnect),
+            ("connect_error", self._on_connect_error),
+            ("connection_confirmed", self._on_connection_confirmed),
+            ("dictation_result", self._on_dictation_result),
+            ("settings_update", self._on_settings_update),
+        )
+        for event, handler in handlers:
+            self.sio.on(event, handler, namespace="/agent")
+
+    def _on_connect(self) -> None:
+        """Handle a (re)established connection to the server."""
+        self.connected = True
+        self.connected_evt.set()
+        log_info(f"Connected to WebSocket server: {CONFIG.websocket_url}")
+        self._disable_nagle()
+        self._drain_outbox()
+
+    def _on_disconnect(self) -> None:
+        """Handle loss of the server connection."""
+        self.connected = False
+        self.connected_evt.clear()
+        self.server_supports_streaming = False
+        log_info("Disconnected from WebSocket server")
 
-        @self.sio.on("connect", namespace="/agent")
-        def on_connect():
-            self.connected = True
-            log_info(f"Connected to WebSocket server: {CONFIG.websocket_url}")
-
-        @self.sio.on("disconnect", namespace="/agent")
-        def on_disconnect():
-            self.connected = False
-            log_info("Disconnected from WebSocket server")
-
-        @self.sio.on("connect_error", namespace="/agent")
-        def on_connect_error(error):
-            log_error(f"Connection error: {error}")
-
-        @self.sio.on("connection_confirmed", namespace="/agent")
-        def on_connection_confirmed(data):
-            log_info(f"Connection confirmed, server time: {data.get('serverTime')}")
-
-        @self.sio.on("dictation_result", namespace="/agent")
-        def on_dictation_result(data):
-            """Handle transcription result from server.
-
-            Processes the server's dictation_result event containing the
-            transcribed and refined text. Extracts the refined text, word
-            count, and processing time from the response, then triggers
-            paste_text() to insert at the cursor position.
-
-            Key Technologies/APIs:
-                - dict.get: Safe dictionary access for optional fields
-                - paste_handler.paste_text: Final text insertion
-
-            Args:
-                data: Dictionary containing server response with keys:
-                    - success (bool): Whether transcription succeeded
-                    - refinedText (str): The processed text to insert
-                    - wordCount (int): Number of words transcribed
-                    - processingTime (int): Server processing time in ms
-                    - error (str): Error message if success is False
-            """
-            if data.get("success"):
-                refined_text = data.get("refinedText", "")
-                word_count = data.get("wordCount", 0)
-                processing_time = data.get("processingTime", 0)
-
-                log_info(f"Received result: {word_count} words, {processing_time}ms")
-                log_info(f"Text to paste: '{refined_text}'")
-
-                # Paste the refined text
-                if refined_text:
-                    self.paste_handler.paste_text(refined_text)
-                else:
-                    log_warning("Refined text is empty, skipping paste")
+    def _on_connect_error(self, error) -> None:
+        """Log a failed connection attempt."""
+        log_error(f"Connection error: {error}")
+
+    def _on_connection_confirmed(self, data) -> None:
+        """Record server capabilities from the connection handshake.
+
+        Servers that can assemble incremental PCM chunks advertise it
+        here; older servers get the one-shot WAV upload instead.
+        """
+        self.server_supports_streaming = bool(data.get("streaming"))
+        log_info(f"Connection confirmed, server time: {data.get('serverTime')}")
+        if self.server_supports_streaming:
+            log_info("Server supports incremental audio streaming")
+
+    def _on_dictation_result(self, data) -> None:
+        """Handle transcription result from server.
+
+        Processes the server's dictation_result event containing the
+        transcribed and refined text. Extracts the refined text, word
+        count, and processing time from the response, then triggers
+        paste_text() to insert at the cursor position.
+
+        Key Technologies/APIs:
+            - dict.get: Safe dictionary access for optional fields
+            - paste_handler.paste_text: Final text insertion
+
+        Args:
+            data: Dictionary containing server response with keys:
+                - success (bool): Whether transcription succeeded
+                - refinedText (str): The processed text to insert
+                - wordCount (int): Number of words transcribed
+                - processingTime (int): Server processing time in ms
+                - error (str): Error message if success is False
+        """
+        if data.get("success"):
+            refined_text = data.get("refinedText", "")
+            word_count = data.get("wordCount", 0)
+            processing_time = data.get("processingTime", 0)
+
+            log_info(f"Received result: {word_count} words, {processing_time}ms")
+            log_info(f"Text to paste: '{refined_text}'")
+
+            # Paste the refined text
+            if refined_text:
+                self.paste_handler.paste_text(refined_text)
             else:
-                error = data.get("error", "Unknown error")
-                log_error(f"Dictation failed: {error}")
-
-        @self.sio.on("settings_update", namespace="/agent")
-        def on_settings_update(data):
-            """Handle settings update from server.
-
-            Updates agent configuration based on server-sent settings
-            changes. Supports updating mode, processingMode, and hotkey
-            configurations dynamically without restart.
-
-            Key Technologies/APIs:
-                - dict.get: Safe access to optional update fields
-                - log_info: Confirmation logging of applied changes
-
-            Args:
-                data: Dictionary containing settings to update:
-                    - mode (str): New processing mode
-                    - processingMode (str): New processing location
-                    - hotkey (str): New hotkey configuration
-            """
-            if "mode" in data:
-                self.mode = data["mode"]
-                log_info(f"Mode updated: {self.mode}")
-
-            if "processingMode" in data:
-                self.processing_mode = data["processingMode"]
-                log_info(f"Processing mode updated: {self.processing_mode}")
-
-            if "hotkey" in data:
-                self.hotkey = data["hotkey"]
-                log_info(f"Hotkey updated: {self.hotkey}")
+                log_warning("Refined text is empty, skipping paste")
+        else:
+            error = data.get("error", "Unknown error")
+            log_error(f"Dictation failed: {error}")
+
+    def _on_settings_update(self, data) -> None:
+        """Handle settings update from server.
+
+        Updates agent configuration based on server-sent settings
+        changes. Supports updating mode, processingMode, and hotkey
+        configurations dynamically without restart.
+
+        Key Technologies/APIs:
+            - dict.get: Safe access to optional update fields
+            - log_info: Confirmation logging of applied changes
+
+        Args:
+            data: Dictionary containing settings to update:
+                - mode (str): New processing mode
+                - processingMode (str): New processing location
+                - hotkey (str): New hotkey configuration
+        """
+        if "mode" in data:
+            self.mode = data["mode"]
+            self._emit_template["mode"] = self.mode
+            log_info(f"Mode updated: {self.mode}")
+
+        if "processingMode" in data:
+            self.processing_mode = data["processingMode"]
+            self._emit_template["processingMode"] = self.processing_mode
+            log_info(f"Processing mode updated: {self.processing_mode}")
+
+        if "hotkey" in data:
+            self.hotkey = data["hotkey"]
+            self._compute_hotkey_tables()
+            log_info(f"Hotkey updated: {self.hotkey}")
+
+    def _emit(self, event: str, data=None) -> None:
+        """Emit a Socket.IO event on /agent with the emit lock held.
+
+        All emits funnel through here. socketio.Client._send_packet
+        writes a binary event as a text header followed by separate
+        attachment packets without taking a lock, so two threads
+        emitting concurrently can interleave an unrelated packet
+        between a header and its attachment and corrupt the server's
+        reconstruction, dropping the connection mid-dictation. The
+        lock makes each emit's packet sequence atomic.
+
+        Key Technologies/APIs:
+            - threading.Lock: Mutual exclusion across the stream,
+              heartbeat, notify-worker, and keyboard hook threads
+
+        Args:
+            event: Socket.IO event name.
+            data: Optional payload forwarded to sio.emit.
+
+        Raises:
+            Whatever sio.emit raises; callers keep their existing
+            error handling.
+        """
+        with self._emit_lock:
+            self.sio.emit(event, data, namespace="/agent")
+
+    def _retry_connect(self) -> None:
+        """Retry the initial connection with jittered exponential backoff.
+
+        socketio.Client only auto-reconnects once a first connect has
+        succeeded; without this loop, an agent started while the server
+        is down would stay offline forever despite the 'retrying'
+        message. Delays double from 1s up to 30s with +/-50% jitter so
+        a fleet of agents does not thundering-herd a server that just
+        came back, and each wait parks on the shutdown Event so agent
+        exit interrupts it immediately.
+
+        Key Technologies/APIs:
+            - random.uniform: Backoff jitter (matches the client's
+              randomization_factor of 0.5)
+            - threading.Event.wait: Cancellable backoff sleep
+
+        Returns:
+            None: Exits once connected or the agent shuts down.
+        """
+        attempt = 0
+        while self.running and not self.connected:
+            # Clamp the exponent, not just the product: float pow
+            # raises OverflowError around 2.0**1024, which would kill
+            # this thread after ~8.5 hours of retries at the cap.
+            delay = min(30.0, 2.0 ** min(attempt, 5)) * random.uniform(0.5, 1.5)
+            if self._stop_evt.wait(timeout=delay):
+                return
+            if self.connected or self.connect():
+                return
+            attempt += 1
+
+    def _disable_nagle(self) -> None:
+        """Set TCP_NODELAY on the underlying websocket transport socket.
+
+        Nagle's algorithm batches small writes for up to ~40ms waiting
+        for an ACK, which adds that much latency to every small emit
+        (heartbeats, recording_started, the audio_end marker). Dictation
+        traffic is latency-sensitive and low-volume, so disabling
+        coalescing is a straight win.
+
+        The socket is reached through private python-engineio/
+        websocket-client attributes, so everything is accessed defensively:
+        if a library upgrade moves the socket, the agent just runs
+        without the optimization instead of crashing.
+
+        Key Technologies/APIs:
+            - socket.setsockopt: IPPROTO_TCP / TCP_NODELAY option
+            - engineio.Client.ws: websocket-client WebSocket instance
+              (present only after the websocket transport is established)
+        """
+        try:
+            ws = getattr(self.sio.eio, "ws", None)
+            sock = getattr(ws, "sock", None)
+            if sock is not None:
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                log_debug("TCP_NODELAY enabled on websocket transport")
+        except (OSError, AttributeError) as e:
+            log_debug(f"Could not set TCP_NODELAY: {e}")
 
     def connect(self) -> bool:
         """Establish WebSocket connection to the LocalFlow server.
@@ -885,12 +1705,26 @@ class LocalFlowAgent:
         """
         try:
             log_info(f"Connecting to {CONFIG.websocket_url}/agent...")
-            self.sio.connect(
-                CONFIG.websocket_url,
-                namespaces=["/agent"],
-                wait_timeout=10,
-                transports=["polling", "websocket"],
-            )
+            try:
+                # Go straight to the websocket transport: starting with
+                # XHR polling and upgrading costs two extra HTTP round
+                # trips on every (re)connect.
+                self.sio.connect(
+                    CONFIG.websocket_url,
+                    namespaces=["/agent"],
+                    wait_timeout=10,
+                    transports=["websocket"],
+                )
+            except Exception:
+                # Some proxies only pass long-polling; retry with the
+                # classic polling+upgrade handshake.
+                log_warning("WebSocket-only connect failed; retrying with polling fallback")
+                self.sio.connect(
+                    CONFIG.websocket_url,
+                    namespaces=["/agent"],
+                    wait_timeout=10,
+                    transports=["polling", "websocket"],
+                )
             return True
         except Exception as e:
             log_error(f"Failed to connect: {e}")
@@ -906,10 +1740,17 @@ class LocalFlowAgent:
         the connection alive through proxies/firewalls and enables early
         detection of network issues.
 
+        While disconnected the thread parks on connected_evt instead of
+        waking every interval to check a bool, and intervals are paced
+        against time.monotonic deadlines so the cadence doesn't drift
+        by the emit duration over long sessions. The inter-ping wait
+        uses the stop event, so shutdown wakes the thread immediately.
+
         Key Technologies/APIs:
+            - threading.Event.wait: Blocking waits for connection state
+              and shutdown, replacing fixed time.sleep polling
+            - time.monotonic: Drift-free interval deadlines
             - socketio.Client.emit: Send ping events on /agent namespace
-            - time.sleep: Interval waiting between heartbeats
-            - Exception handling for network errors during emit
 
         Returns:
             None: This method runs indefinitely until self.running is False.
@@ -919,12 +1760,20 @@ class LocalFlowAgent:
             be started via threading.Thread(target=self._send_heartbeat).
         """
         while self.running:
-            if self.connected:
-                try:
-                    self.sio.emit("ping", namespace="/agent")
-                except Exception as e:
-                    log_debug(f"Heartbeat error: {e}")
-            time.sleep(CONFIG.heartbeat_interval)
+            # Park until connected; the timeout only bounds how long
+            # shutdown detection can lag while disconnected.
+            if not self.connected_evt.wait(timeout=1.0):
+                continue
+
+            deadline = time.monotonic() + CONFIG.heartbeat_interval
+            try:
+                self._emit("ping")
+            except Exception as e:
+                log_debug(f"Heartbeat error: {e}")
+
+            remaining = deadline - time.monotonic()
+            if remaining > 0 and self._stop_evt.wait(timeout=remaining):
+                break
 
     def toggle_translation(self) -> None:
         """Toggle translation mode on/off with visual feedback.
@@ -977,8 +1826,9 @@ class LocalFlowAgent:
             None
         """
         if self.recorder.start():
-            # Show visual feedback
-            self.overlay.show()
+            # Show visual feedback (queued; Tk work happens off the
+            # keyboard hook thread)
+            self._ui_q.put(("show", None))
 
             # Log mode for debugging (overlay already shows visual animation)
             if translate_mode:
@@ -997,123 +1847,276 @@ class LocalFlowAgent:
             if translate_mode:
                 log_info("Translation mode activated (Alt+T)")
 
-            # Notify server
-            if self.connected:
-                try:
-                    self.sio.emit(
+            # Notify server (fire-and-forget via the notify worker)
+            self._ui_q.put(
+                (
+                    "emit",
+                    (
                         "recording_started",
                         {
-                            "timestamp": int(time.time() * 1000), 
+                            "timestamp": time.time_ns() // 1_000_000,
                             "format_mode": format_mode,
-                            "translate_mode": translate_mode
+                            "translate_mode": translate_mode,
+                            "sampleRate": CONFIG.sample_rate,
+                            "channels": CONFIG.channels,
                         },
-                        namespace="/agent",
-                    )
-                except Exception as e:
-                    log_debug(f"Failed to notify recording start: {e}")
+                    ),
+                )
+            )
+
+            # Stream PCM incrementally when the server supports it, so
+            # transcription can start as soon as the hotkey is released
+            # instead of after a full-clip upload.
+            self._stream_thread = None
+            if self.connected and self.server_supports_streaming:
+                self._stream_sent = 0
+                self._stream_failed = False
+                self._stream_thread = threading.Thread(target=self._stream_loop, daemon=True)
+                self._stream_thread.start()
+
+    def _flush_stream(self) -> None:
+        """Send any newly captured PCM frames to the server.
+
+        Reads the recorder's write index, slices the frames not yet
+        transmitted, and emits them as a binary audio_chunk event.
+        python-socketio sends bytes payloads as binary Engine.IO
+        attachments, so no base64 inflation occurs.
+
+        Key Technologies/APIs:
+            - AudioRecorder.read_pcm: Raw int16 PCM slice of new frames
+            - socketio.Client.emit: Binary frame transmission
+
+        Returns:
+            None: Failures set _stream_failed so _stop_recording can
+                fall back to the one-shot WAV upload.
+        """
+        current = self.recorder.frames_recorded()
+        if current <= self._stream_sent:
+            return
+
+        chunk = self.recorder.read_pcm(self._stream_sent, current)
+        try:
+            self._emit("audio_chunk", chunk)
+            self._stream_sent = current
+        except Exception as e:
+            log_debug(f"Audio chunk emit failed: {e}")
+            self._stream_failed = True
+
+    def _stream_loop(self) -> None:
+        """Background loop flushing captured audio while recording.
+
+        Runs in a daemon thread for the duration of a recording
+        session, flushing newly captured PCM to the server every
+        STREAM_CHUNK_INTERVAL seconds. Exits when recording stops or a
+        chunk emit fails (at which point the one-shot WAV fallback
+        takes over).
+
+        Returns:
+            None
+        """
+        while self.recorder.is_recording() and not self._stream_failed:
+            time.sleep(STREAM_CHUNK_INTERVAL)
+            self._flush_stream()
+
+    def _notify_loop(self) -> None:
+        """Worker loop applying overlay updates and informational emits.
+
+        Consumes (action, payload) tuples from the UI queue: 'show' and
+        'hide' drive the recording overlay, 'emit' sends fire-and-forget
+        events like recording_started. Keeping this work off the pynput
+        callback thread means a hotkey press costs only a queue put
+        before the audio stream starts - Tk window creation and socket
+        writes happen here instead.
+
+        Key Technologies/APIs:
+            - queue.SimpleQueue.get: Blocking, allocation-free handoff
+            - RecordingOverlay.show/hide: Tk overlay control
+            - socketio.Client.emit: Fire-and-forget notifications
+
+        Returns:
+            None: Exits when a None sentinel is queued at shutdown.
+        """
+        while True:
+            item = self._ui_q.get()
+            if item is None:
+                break
+
+            action, payload = item
+            try:
+                if action == "show":
+                    self.overlay.show()
+                elif action == "hide":
+                    self.overlay.hide()
+                elif action == "emit":
+                    event, data = payload
+                    if self.connected:
+                        self._emit(event, data)
+            except Exception as e:
+                log_debug(f"Notify worker error: {e}")
+
+    def _audio_payload(self, effective_mode: str) -> dict:
+        """Build a process_audio payload from the cached template.
+
+        Copies the constant metadata template (type, mode,
+        processingMode - refreshed only on settings_update) and fills
+        in the per-recording fields. Callers add the audio itself
+        ('audio' base64 string or 'pcm' binary attachment).
+
+        Args:
+            effective_mode: Refinement mode for this clip, which may
+                differ from the template's default (e.g. format-mode
+                recordings use 'outline').
+
+        Returns:
+            dict: Payload ready for the audio to be attached.
+        """
+        payload = self._emit_template.copy()
+        payload["mode"] = effective_mode
+        payload["translate"] = self.translate_mode_active
+        payload["timestamp"] = time.time_ns() // 1_000_000
+        return payload
+
+    def _queue_for_retry(self, effective_mode: str) -> None:
+        """Queue the current recording for delivery after reconnect.
+
+        Encodes the recorded audio as a base64 WAV process_audio payload
+        (understood by every server version) and appends it to the
+        bounded outbox. Called when the agent is disconnected at hotkey
+        release or the send attempt fails; previously the dictation was
+        silently dropped.
+
+        Args:
+            effective_mode: Refinement mode to request for this clip.
+
+        Returns:
+            None
+        """
+        audio_bytes = self.recorder.encode_wav()
+        if not audio_bytes:
+            return
+
+        payload = self._audio_payload(effective_mode)
+        payload["audio"] = base64.b64encode(audio_bytes).decode("ascii")
+        self._outbox.append(("process_audio", payload))
+        log_warning(f"Dictation queued for retry ({len(self._outbox)} pending)")
+
+    def _drain_outbox(self) -> None:
+        """Send queued dictations after a reconnect, oldest first.
+
+        Emits each buffered (event, payload) pair in FIFO order. If an
+        emit fails the payload is pushed back to the front and draining
+        stops; the next successful connect will retry.
+
+        Returns:
+            None
+        """
+        while self._outbox:
+            event, payload = self._outbox.popleft()
+            try:
+                self._emit(event, payload)
+                log_info(f"Sent queued dictation ({len(self._outbox)} remaining)")
+            except Exception as e:
+                self._outbox.appendleft((event, payload))
+                log_error(f"Failed to drain outbox: {e}")
+                break
 
     def _stop_recording(self) -> None:
         """Stop recording and transmit audio to server for processing.
 
-        Halts the audio recorder, hides the visual overlay, encodes
-        the captured audio as base64, and sends it to the server via
-        the process_audio event. Determines the effective processing
-        mode and translation settings.
+        Halts the audio recorder and hides the visual overlay. When the
+        recording was streamed incrementally, the remaining tail of PCM
+        is flushed and an audio_end event with processing metadata tells
+        the server to assemble and process what it already has. Otherwise
+        (older server, or a chunk emit failed mid-recording), the full
+        clip is encoded as WAV, base64-wrapped, and sent via the one-shot
+        process_audio event.
         """
         # Hide visual feedback
-        self.overlay.hide()
-
-        audio_bytes = self.recorder.stop()
+        self._ui_q.put(("hide", None))
 
         # Determine effective mode
         effective_mode = "outline" if self.format_mode_active else self.mode
-        
-        if audio_bytes:
-            # Convert to base64
-            audio_base64 = base64.b64encode(audio_bytes).decode("utf-8")
 
-            # Send to server
-            if self.connected:
+        streamed = self._stream_thread is not None
+        self.recorder.stop(encode_wav=False)
+
+        if streamed:
+            self._stream_thread.join(timeout=1.0)
+            self._stream_thread = None
+
+        # Accidental tap: nothing worth transcribing was captured, so
+        # skip the send entirely. Any chunks already streamed are
+        # discarded server-side at the next recording_started.
+        if self.recorder.frames_recorded() < int(MIN_RECORDING_SECONDS * CONFIG.sample_rate):
+            log_info("Recording too short, skipping")
+            self.format_mode_active = False
+            self.translate_mode_active = False
+            return
+
+        sent_via_stream = False
+        if streamed and not self._stream_failed:
+            # Flush the tail captured since the last interval tick,
+            # then tell the server the utterance is complete.
+            self._flush_stream()
+            if not self._stream_failed:
                 try:
-                    self.sio.emit(
-                        "process_audio",
+                    self._emit(
+                        "audio_end",
                         {
-                            "type": "process_audio",
-                            "audio": audio_base64,
                             "mode": effective_mode,
                             "processingMode": self.processing_mode,
                             "translate": self.translate_mode_active,
-                            "timestamp": int(time.time() * 1000),
+                            "sampleRate": CONFIG.sample_rate,
+                            "channels": CONFIG.channels,
+                            "timestamp": time.time_ns() // 1_000_000,
                         },
-                        namespace="/agent",
                     )
-                    log_info(f"Audio sent ({'Translate' if self.translate_mode_active else 'Normal'})")
+                    sent_via_stream = True
+                    log_info(f"Audio streamed ({'Translate' if self.translate_mode_active else 'Normal'})")
                 except Exception as e:
-                    log_error(f"Failed to send audio: {e}")
+                    log_error(f"Failed to finish audio stream: {e}")
+
+        if not sent_via_stream:
+            if not self.connected:
+                log_error("Not connected to server; queueing dictation")
+                self._queue_for_retry(effective_mode)
+            elif self.server_supports_streaming:
+                # Streaming-capable servers accept raw PCM as a binary
+                # attachment, so skip the WAV wrap and base64 inflation.
+                pcm = self.recorder.read_pcm(0, self.recorder.frames_recorded())
+                if pcm:
+                    payload = self._audio_payload(effective_mode)
+                    payload["pcm"] = pcm
+                    payload["sampleRate"] = CONFIG.sample_rate
+                    payload["channels"] = CONFIG.channels
+                    try:
+                        self._emit("process_audio", payload)
+                        log_info(f"Audio sent ({'Translate' if self.translate_mode_active else 'Normal'})")
+                    except Exception as e:
+                        log_error(f"Failed to send audio: {e}")
+                        self._queue_for_retry(effective_mode)
+                else:
+                    log_error("No audio data recorded")
             else:
-                log_error("Not connected to server")
+                # Legacy servers only understand base64-encoded WAV.
+                audio_bytes = self.recorder.encode_wav()
+
+                if audio_bytes:
+                    # Convert to base64
+                    payload = self._audio_payload(effective_mode)
+                    payload["audio"] = base64.b64encode(audio_bytes).decode("ascii")
+
+                    try:
+                        self._emit("process_audio", payload)
+                        log_info(f"Audio sent ({'Translate' if self.translate_mode_active else 'Normal'})")
+                    except Exception as e:
+                        log_error(f"Failed to send audio: {e}")
+                        self._queue_for_retry(effective_mode)
 
         # Reset flags
         self.format_mode_active = False
         self.translate_mode_active = False
 
-    def _parse_hotkey(self, hotkey_str: str) -> set:
-        """Parse a hotkey string into virtual key codes.
-
-        Converts human-readable hotkey strings like "alt+z" into sets
-        of Windows virtual key codes (VK codes) used for low-level
-        keyboard event matching. Supports modifier keys (alt, ctrl,
-        shift) and special characters.
-
-        Key Technologies/APIs:
-            - str.split/str.lower: String parsing and normalization
-            - ord(): Character to ASCII/Unicode code point conversion
-            - Windows VK codes: Virtual key code constants (164=Alt,
-              162=Ctrl, 160=Shift, 191=OEM_2)
-
-        Args:
-            hotkey_str: Hotkey combination string like "alt+z",
-                "ctrl+shift+f", or "alt+/". Case insensitive.
-
-        Returns:
-            set: Set of integer virtual key codes representing the
-                parsed hotkey combination.
-
-        Example:
-            >>> agent = LocalFlowAgent()
-            >>> codes = agent._parse_hotkey("alt+z")
-            >>> print(codes)
-            {164, 90}
-        """
-        parts = hotkey_str.lower().replace("+", " ").split()
-        vk_codes = set()
-
-        # Virtual key codes for modifier keys
-        vk_map = {
-            "alt": 164,  # VK_LMENU (left alt)
-            "ctrl": 162,  # VK_LCONTROL
-            "control": 162,
-            "shift": 160,  # VK_LSHIFT
-        }
-
-        # Special keys with VK codes different from ASCII
-        special_keys = {
-            "/": 191,  # VK_OEM_2 (/ ? key)
-            "?": 191,  # Same key, shifted
-        }
-
-        for part in parts:
-            if part in vk_map:
-                vk_codes.add(vk_map[part])
-            elif part in special_keys:
-                vk_codes.add(special_keys[part])
-            elif len(part) == 1:
-                # For regular characters, use ord() to get the virtual key code
-                vk_codes.add(ord(part.upper()))
-
-        log_info(f"Parsed hotkey '{hotkey_str}' -> vk_codes: {vk_codes}")
-        return vk_codes
-
     def _get_vk(self, key) -> Optional[int]:
         """Extract the virtual key code from a pynput Key object.
 
@@ -1140,136 +2143,192 @@ class LocalFlowAgent:
             >>> agent._get_vk(keyboard.Key.alt_l)
             164
         """
-        # Handle modifier keys with their vk codes
-        modifier_vk_map = {
-            keyboard.Key.alt_l: 164,
-            keyboard.Key.alt_r: 165,
-            keyboard.Key.alt: 164,  # Default to left alt
-            keyboard.Key.ctrl_l: 162,
-            keyboard.Key.ctrl_r: 163,
-            keyboard.Key.ctrl: 162,
-            keyboard.Key.shift: 160,
-            keyboard.Key.shift_l: 160,
-            keyboard.Key.shift_r: 161,
-        }
-
-        if key in modifier_vk_map:
-            return modifier_vk_map[key]
+        # Handle modifier keys with their vk codes (precomputed at
+        # import time; see _SPECIAL_KEY_VKS)
+        vk = _SPECIAL_KEY_VKS.get(key)
+        if vk is not None:
+            return vk
+
+        # Character keys must be matched by char, not raw vk: the
+        # tables hold Windows-style codes (ord of the uppercase
+        # letter), but pynput's X11 backend sets vk to the keysym
+        # ('l' -> 108) and macOS to the Quartz keycode ('l' -> 37), so
+        # only the char maps consistently across platforms. Fold ASCII
+        # lowercase to uppercase with a bitmask instead of str.upper(),
+        # which allocates a new string per keystroke.
+        c = getattr(key, "char", None)
+        if c:
+            return ord(c) & 0xDF if "a" <= c <= "z" else ord(c)
+
+        # Last resort for KeyCodes with no char (dead keys, media
+        # keys); on Windows this is the true VK code.
+        return getattr(key, "vk", None)
+
+    def _compute_hotkey_tables(self) -> None:
+        """Precompute the vk-code lookup tables for hotkey matching.
+
+        Runs the configured hotkey strings through the memoized
+        _parse_hotkey and builds the structures the listener callbacks
+        consult per key event: a frozenset of Alt-variant vk codes and
+        a dict mapping each trigger key's vk code to its (format_mode,
+        translate_mode) flags. Called at listener setup and again
+        whenever the server pushes a hotkey change via settings_update,
+        so the hot path never re-parses strings.
+
+        Only Alt-based hotkeys are supported; a hotkey using other
+        modifiers (e.g. "ctrl+shift+f") is not registered - with a
+        warning - rather than being silently rebound to Alt+letter.
 
-        # For KeyCode objects
-        if hasattr(key, "vk") and key.vk is not None:
-            return key.vk
-
-        # For character keys
-        if hasattr(key, "char") and key.char:
-            return ord(key.char.upper())
+        Returns:
+            None: Results are stored on self._alt_vks/_trigger_vks.
+        """
 
-        return None
+        def trigger_vk(hotkey_str: str, default_char: str) -> Optional[int]:
+            parsed = _parse_hotkey(hotkey_str)
+            if (parsed & _MODIFIER_VKS) - _ALT_VKS:
+                log_warning(
+                    f"Hotkey '{hotkey_str}' uses non-Alt modifiers; only "
+                    "Alt-based hotkeys are supported - not registering it"
+                )
+                return None
+            non_modifier = parsed - _MODIFIER_VKS
+            return next(iter(non_modifier), ord(default_char.upper()))
+
+        self._alt_vks = _ALT_VKS
+        triggers = {
+            trigger_vk(self.hotkey, "l"): (False, False),
+            trigger_vk(self.format_hotkey, "m"): (True, False),
+            trigger_vk(self.translate_hotkey, "t"): (False, True),
+        }
+        triggers.pop(None, None)  # Hotkeys rejected above
+        self._trigger_vks = triggers
+        # Every vk the listener cares about; all other keystrokes bail
+        # out of the callbacks with a single membership test.
+        self._tracked_vks = self._alt_vks | frozenset(self._trigger_vks)
 
     def _setup_hotkey_listener(self):
-        """Configure global hotkey listeners for recording triggers.
-
-        Sets up two keyboard listeners: a GlobalHotKeys instance for
-        detecting hotkey presses (which triggers recording start), and
-        a regular Listener for tracking key releases (which triggers
-        recording stop). This push-to-talk behavior requires holding
-        the hotkey combination for the duration of recording.
+        """Configure the global hotkey listener for recording triggers.
+
+        Sets up a single keyboard.Listener that handles both press and
+        release sides of the push-to-talk gesture, matching events
+        inline against precomputed virtual key code sets. One OS-level
+        hook means one wakeup per key event (the previous GlobalHotKeys
+        + Listener pair hooked the keyboard twice).
+
+        Chord suppression: returning False from a pynput callback does
+        NOT suppress the event - it raises StopException and stops the
+        listener for good. The only per-event suppression pynput offers
+        is the Windows-specific win32_event_filter, whose
+        suppress_event() swallows the event system-wide before it
+        reaches the focused application. Events suppressed there never
+        reach on_press/on_release, so the filter applies the same state
+        transitions itself. On other platforms the chord cannot be
+        suppressed per-event and the trigger letter may leak into the
+        focused app (the baseline had the same limitation).
 
         Key Technologies/APIs:
-            - pynput.keyboard.GlobalHotKeys: Global hotkey registration
-              with automatic callback invocation
-            - pynput.keyboard.Listener: Low-level key event monitoring
-            - pynput.keyboard.Key: Special key constants for modifier
-              detection and release tracking
-            - lambda closures: Hotkey callback binding with format_mode
+            - pynput.keyboard.Listener: Low-level key event monitoring;
+              callbacks must return True (False stops the listener)
+            - win32_event_filter + Listener.suppress_event: Per-event
+              chord suppression on Windows (ignored on other platforms)
+            - frozenset membership: O(1) vk-code matching per key event
 
         Returns:
-            object: A mock listener object with a stop() method for
-                compatibility with the cleanup code in run().
+            keyboard.Listener: The running listener, exposing stop()
+                for the cleanup code in run().
 
         Note:
             This method must be called from the main thread as keyboard
             listeners have thread-safety requirements on some platforms.
         """
-        from pynput.keyboard import GlobalHotKeys, Key, KeyCode
-
-        hotkeys = {}
+        self._compute_hotkey_tables()
 
-        # Store hotkey chars locally for release detection
-        parts = self.hotkey.lower().replace("+", " ").split()
-        format_parts = self.format_hotkey.lower().replace("+", " ").split()
-        translate_parts = self.translate_hotkey.lower().replace("+", " ").split()
-        
-        hotkey_char = parts[1] if len(parts) >= 2 else "l"
-        format_char = format_parts[1] if len(format_parts) >= 2 else "m"
-        translate_char = translate_parts[1] if len(translate_parts) >= 2 else "t"
-
-        # Register Regular Recording Hotkey
-        if parts[0] == "alt":
-            for alt_key in [Key.alt_l, Key.alt_r, Key.alt_gr]:
-                alt_names = {Key.alt_l: "<alt_l>", Key.alt_r: "<alt_r>", Key.alt_gr: "<alt_gr>"}
-                combo_str = alt_names[alt_key] + "+" + hotkey_char
-                hotkeys[combo_str] = lambda: self._on_hotkey_press(format_mode=False, translate_mode=False)
-
-        # Register Format Recording Hotkey
-        if format_parts[0] == "alt":
-            for alt_key in [Key.alt_l, Key.alt_r, Key.alt_gr]:
-                alt_names = {Key.alt_l: "<alt_l>", Key.alt_r: "<alt_r>", Key.alt_gr: "<alt_gr>"}
-                combo_str = alt_names[alt_key] + "+" + format_char
-                hotkeys[combo_str] = lambda: self._on_hotkey_press(format_mode=True, translate_mode=False)
-
-        # Register Translate Recording Hotkey
-        if translate_parts[0] == "alt":
-            for alt_key in [Key.alt_l, Key.alt_r, Key.alt_gr]:
-                alt_names = {Key.alt_l: "<alt_l>", Key.alt_r: "<alt_r>", Key.alt_gr: "<alt_gr>"}
-                combo_str = alt_names[alt_key] + "+" + translate_char
-                hotkeys[combo_str] = lambda: self._on_hotkey_press(format_mode=False, translate_mode=True)
-
-        log_info(f"Registering recording hotkeys: {list(hotkeys.keys())}")
-
-        # Create GlobalHotKeys instance
-        self.hotkey_listener = GlobalHotKeys(hotkeys)
-
-        # Track pressed keys for release detection
-        self.pressed_keys = set()
+        # Currently held Alt-variant vk codes. Only modifier state is
+        # tracked - trigger keys are matched directly - so ordinary
+        # typing never touches the set.
+        self.pressed_vks = set()
 
         def on_press(key):
             if self.pasting_in_progress:
-                return
-            self.pressed_keys.add(key)
+                return True
+
+            vk = self._get_vk(key)
+            if vk is None or vk not in self._tracked_vks:
+                # The common case: a key we don't care about. One
+                # membership test, no state mutation, no allocation.
+                return True
+
+            if vk in self._alt_vks:
+                self.pressed_vks.add(vk)
+                return True
+
+            mode_flags = self._trigger_vks.get(vk)
+            if mode_flags is not None and self.pressed_vks:
+                self._on_hotkey_press(format_mode=mode_flags[0], translate_mode=mode_flags[1])
+            return True
 
         def on_release(key):
             if self.pasting_in_progress:
-                return
-            self.pressed_keys.discard(key)
+                return True
+
+            vk = self._get_vk(key)
+            if vk is None or vk not in self._tracked_vks:
+                return True
 
-            # Stop recording if ANY of the relevant hotkey parts are released
+            if vk in self._alt_vks:
+                self.pressed_vks.discard(vk)
+
+            # Stop recording when any part of the held chord is released
             if self.hotkey_pressed and self.recorder.is_recording():
-                is_alt = key in [Key.alt_l, Key.alt_r, Key.alt_gr, Key.alt]
-                
-                is_char = False
-                if hasattr(key, "char") and key.char:
-                    k = key.char.lower()
-                    is_char = k in [hotkey_char, format_char, translate_char]
-                
-                # Double check VK codes for letters
-                vk = self._get_vk(key)
-                if vk:
-                    vks = [ord(c.upper()) for c in [hotkey_char, format_char, translate_char]]
-                    if vk in vks:
-                        is_char = True
-
-                if is_alt or is_char:
+                self.hotkey_pressed = False
+                log_info("Hotkey released! Stopping recording...")
+                self._stop_recording()
+            return True
+
+        def win32_event_filter(msg, data):
+            # Runs on the hook thread before callback dispatch; events
+            # suppressed here are swallowed system-wide and never reach
+            # on_press/on_release, so the hotkey state machine runs
+            # here for the events we eat. Everything else (Alt
+            # bookkeeping, releases outside a recording) falls through
+            # to the callbacks untouched.
+            if self.pasting_in_progress:
+                return True
+            vk = data.vkCode
+            if vk not in self._tracked_vks:
+                return True
+            if msg in _WM_KEYDOWNS:
+                mode_flags = self._trigger_vks.get(vk)
+                if mode_flags is not None and self.pressed_vks:
+                    self._on_hotkey_press(
+                        format_mode=mode_flags[0], translate_mode=mode_flags[1]
+                    )
+                    # Eat the trigger keystroke so the letter doesn't
+                    # leak into the focused app (terminals especially).
+                    self.listener.suppress_event()
+            elif msg in _WM_KEYUPS:
+                if self.hotkey_pressed and self.recorder.is_recording():
+                    self.pressed_vks.discard(vk)
                     self.hotkey_pressed = False
                     log_info("Hotkey released! Stopping recording...")
                     self._stop_recording()
+                    self.listener.suppress_event()
+            return True
 
-        # Start listeners
-        self.release_listener = keyboard.Listener(on_press=on_press, on_release=on_release)
-        self.release_listener.start()
-        self.hotkey_listener.start()
+        log_info(
+            f"Listening for hotkeys: record={self.hotkey}, "
+            f"format={self.format_hotkey}, translate={self.translate_hotkey}"
+        )
 
-        return type("MockListener", (), {"stop": lambda: None})()
+        # The win32_ prefix makes pynput apply the filter only on the
+        # Windows backend; other platforms ignore the argument.
+        self.listener = keyboard.Listener(
+            on_press=on_press,
+            on_release=on_release,
+            win32_event_filter=win32_event_filter,
+        )
+        self.listener.start()
+        return self.listener
 
     def _on_hotkey_press(self, format_mode: bool = False, translate_mode: bool = False) -> None:
         """Handle global hotkey press events.
@@ -1314,24 +2373,31 @@ class LocalFlowAgent:
             [INFO] Listening for hotkey: alt+z
             ^C[INFO] Shutting down...
         """
-        log_info("=" * 60)
+        log_info(_BANNER)
         log_info("LocalFlow Desktop Agent")
-        log_info("=" * 60)
+        log_info(_BANNER)
         log_info(f"Hotkey (raw): {self.hotkey}")
         log_info(f"Hotkey (format): {self.format_hotkey}")
         log_info(f"Hotkey (translate): {self.translate_hotkey}")
         log_info(f"Mode: {self.mode}")
         log_info(f"Processing: {self.processing_mode}")
-        log_info("=" * 60)
+        log_info(_BANNER)
 
-        # Connect to server
+        # Connect to server. socketio.Client's built-in reconnection
+        # only engages after a successful first connect, so a failed
+        # initial attempt needs its own retry loop.
         if not self.connect():
             log_error("Failed to connect to server. Retrying in background...")
+            threading.Thread(target=self._retry_connect, daemon=True).start()
 
         # Start heartbeat thread
         heartbeat_thread = threading.Thread(target=self._send_heartbeat, daemon=True)
         heartbeat_thread.start()
 
+        # Start notify worker (overlay + fire-and-forget emits)
+        notify_thread = threading.Thread(target=self._notify_loop, daemon=True)
+        notify_thread.start()
+
         # Set up hotkey listener
         listener = self._setup_hotkey_listener()
         log_info(f"Listening for hotkey: {self.hotkey}")
@@ -1340,12 +2406,19 @@ class LocalFlowAgent:
         log_info("Press Ctrl+C to exit.")
 
         try:
-            while self.running:
-                time.sleep(0.1)
+            # Block on the stop event instead of a 100ms poll loop. The
+            # 1s timeout exists only because Ctrl+C cannot interrupt a
+            # plain Event.wait() on Windows; it still cuts idle wake-ups
+            # 10x versus the old time.sleep(0.1) spin.
+            while self.running and not self._stop_evt.wait(timeout=1.0):
+                pass
         except KeyboardInterrupt:
             log_info("\nShutting down...")
         finally:
             self.running = False
+            self._stop_evt.set()
+            self._ui_q.put(None)  # Release the notify worker
+            self.paste_handler.shutdown()
             listener.stop()
             if self.connected:
                 self.sio.disconnect()
@@ -1360,12 +2433,13 @@ class LocalFlowAgent:
 def check_dependencies() -> None:
     """Verify all required Python packages are installed.
 
-    Performs import checks for all runtime dependencies and reports
+    Resolves each runtime dependency on the import path and reports
     any missing packages with installation instructions. Exits the
     program with status 1 if dependencies are missing.
 
     Key Technologies/APIs:
-        - importlib-style dynamic imports via try/except
+        - importlib.util.find_spec: Presence check without importing
+          (no module code executes, keeping startup fast)
         - sys.exit: Program termination with error code
 
     Returns:
@@ -1379,42 +2453,21 @@ def check_dependencies() -> None:
         # Exits silently if all dependencies present
         # Or prints missing packages and exits with code 1
     """
-    missing = []
-
-    try:
-        import numpy
-    except ImportError:
-        missing.append("numpy")
-
-    try:
-        import sounddevice
-    except ImportError:
-        missing.append("sounddevice")
-
-    try:
-        import scipy
-    except ImportError:
-        missing.append("scipy")
-
-    try:
-        import pyperclip
-    except ImportError:
-        missing.append("pyperclip")
-
-    try:
-        import pyautogui
-    except ImportError:
-        missing.append("pyautogui")
-
-    try:
-        import pynput
-    except ImportError:
-        missing.append("pynput")
-
-    try:
-        import socketio
-    except ImportError:
-        missing.append("python-socketio")
+    from importlib.util import find_spec
+
+    # (importable module, pip install name). find_spec only resolves
+    # the module on the path - nothing is imported or executed - so
+    # the check costs a few stat calls instead of pulling numpy and
+    # friends into memory just to verify they exist.
+    required = (
+        ("numpy", "numpy"),
+        ("sounddevice", "sounddevice"),
+        ("pyperclip", "pyperclip"),
+        ("pyautogui", "pyautogui"),
+        ("pynput", "pynput"),
+        ("socketio", "python-socketio"),
+    )
+    missing = [pip_name for module, pip_name in required if find_spec(module) is None]
 
     if missing:
         print("Missing dependencies:")
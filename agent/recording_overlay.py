@@ -61,6 +61,32 @@ import math
 import time
 from typing import Optional
 
+# Sine lookup table for animation curves. The waveform only needs to look
+# smooth at ~30 FPS, so a 256-entry table is visually indistinguishable
+# from math.sin while avoiding three libm calls per bar per frame.
+_SIN_TABLE_SIZE = 256
+_SIN_SCALE = _SIN_TABLE_SIZE / (2 * math.pi)
+_SIN_TABLE = tuple(math.sin(i / _SIN_SCALE) for i in range(_SIN_TABLE_SIZE))
+
+
+def _fast_sin(phase: float) -> float:
+    """Table-based sine approximation for animation phase values."""
+    return _SIN_TABLE[int(phase * _SIN_SCALE) % _SIN_TABLE_SIZE]
+
+
+def _blend(color_a: str, color_b: str) -> str:
+    """Per-channel average of two #rrggbb colors."""
+    return "#" + "".join(
+        f"{(int(color_a[i:i + 2], 16) + int(color_b[i:i + 2], 16)) // 2:02x}"
+        for i in (1, 3, 5)
+    )
+
+
+# REC indicator pulse palette. The red shade only ever takes values in
+# 200-255, so all 56 color strings are built once at import time and the
+# frame loop indexes the tuple instead of formatting an f-string.
+_REC_COLORS = tuple(f"#{shade:02x}4040" for shade in range(200, 256))
+
 
 class RecordingOverlay:
     """A floating visual overlay window for recording feedback.
@@ -91,12 +117,14 @@ class RecordingOverlay:
 
     Attributes:
         bar_count: Number of animated waveform bars to display.
-        root: The tkinter.Tk root window when visible, None when hidden.
-        canvas: The tkinter.Canvas drawing surface when visible.
-        is_visible: Boolean tracking overlay visibility state.
+        root: The tkinter.Tk root window, created on first show() and
+            kept alive (withdrawn while hidden) for the process lifetime.
+        canvas: The tkinter.Canvas drawing surface, created with root.
+        is_visible: Property reflecting overlay visibility state.
         animation_running: Boolean controlling animation loop execution.
-        animation_thread: Thread running the Tkinter mainloop.
-        _lock: threading.Lock for thread-safe state access.
+        _tk_thread: Long-lived daemon thread running the Tkinter mainloop.
+        _tk_ready: threading.Event set once the root window exists.
+        _visible: threading.Event tracking visibility (lock-free reads).
         bg_color: Background color of the overlay window.
         bar_colors: List of colors for waveform bars (rainbow effect).
         shimmer_color: Color for the animated shimmer highlight.
@@ -138,15 +166,28 @@ class RecordingOverlay:
         self.bar_count = bar_count
         self.root: Optional[tk.Tk] = None
         self.canvas: Optional[tk.Canvas] = None
-        self.is_visible = False
         self.animation_running = False
-        self.animation_thread: Optional[threading.Thread] = None
-        self._lock = threading.Lock()
+
+        # Visibility flag. An Event is lock-free on the is_set() fast path
+        # and every transition has a single writer (the hotkey thread), so
+        # no mutex is needed around the check-then-set in show()/hide().
+        self._visible = threading.Event()
+
+        # Single long-lived Tkinter thread. The root window is created once
+        # on first show() and then toggled with withdraw()/deiconify();
+        # tearing down and rebuilding a whole Tk interpreter per recording
+        # cost tens of milliseconds and leaked event-loop threads.
+        self._tk_thread: Optional[threading.Thread] = None
+        self._tk_ready = threading.Event()
 
         # Colors
         self.bg_color = "#1a1a2e"
         self.bar_colors = ["#ff6b6b", "#4ecdc4", "#45b7d1", "#96ceb4", "#feca57"]
         self.shimmer_color = "#ffffff"
+        # Solid 50%-white blends of the bar colors: visually equivalent to
+        # the old stippled white highlight, but a plain rectangle fill
+        # skips Tk's bitmap-stipple compositing path entirely
+        self._shimmer_colors = [_blend(c, self.shimmer_color) for c in self.bar_colors]
 
         # Overlay dimensions
         self.width = 120
@@ -155,10 +196,45 @@ class RecordingOverlay:
         self.bar_gap = 8
         self.corner_radius = 12
 
+        # Persistent canvas items (created once in _create_window,
+        # repositioned/recolored every frame by _draw_frame)
+        self._bar_xs: list = []
+        self._bar_items: list = []
+        self._shimmer_items: list = []
+        self._rec_item: Optional[int] = None
+
+        # Last-drawn state, quantized to whole pixels / color steps, so
+        # frames that round to identical output skip the Tcl calls entirely
+        self._last_bar_y: list = []
+        self._last_shimmer: list = []
+        self._last_rec_shade: Optional[int] = None
+
         # Animation state
         self.phase = 0.0
         self.shimmer_phase = 0.0
 
+        # Animation chain generation. Each (re)start bumps the counter and
+        # stamps it into the after() callbacks; a stale callback from a
+        # previous show/hide cycle sees a mismatched generation and dies,
+        # so rapid show-hide-show can never leave two chains running.
+        self._anim_gen = 0
+
+        # Per-bar phase offsets are fixed for the life of the overlay, so
+        # compute them once here instead of multiplying inside the frame loop
+        self._wave_offsets = tuple(i * 0.8 for i in range(bar_count))
+        self._shimmer_offsets = tuple(i * 0.3 for i in range(bar_count))
+
+        # Frame pacing: full rate while the window is actually viewable,
+        # a slow keepalive tick when it is unmapped/occluded so a hidden
+        # overlay doesn't burn 33 frames a second drawing nothing.
+        self.active_delay_ms = 30
+        self.idle_delay_ms = 500
+
+    @property
+    def is_visible(self) -> bool:
+        """Whether the overlay is currently shown (lock-free read)."""
+        return self._visible.is_set()
+
     def _create_window(self) -> None:
         """Create and configure the Tkinter overlay window.
 
@@ -187,6 +263,8 @@ class RecordingOverlay:
         """
         self.root = tk.Tk()
         self.root.title("Recording")
+        # Start withdrawn; _show_on_tk deiconifies once everything is built
+        self.root.withdraw()
 
         # Make it a tool window (no taskbar entry)
         self.root.overrideredirect(True)
@@ -221,6 +299,53 @@ class RecordingOverlay:
             2, 2, self.width - 2, self.height - 2, self.corner_radius, fill="#2d2d44", outline="#4a4a6a"
         )
 
+        # Create every animated item exactly once; _draw_frame only moves
+        # and recolors them with coords()/itemconfigure(), which is far
+        # cheaper than deleting and recreating canvas objects per frame.
+        total_width = (self.bar_width * self.bar_count) + (self.bar_gap * (self.bar_count - 1))
+        start_x = (self.width - total_width) / 2
+        mid_y = self.height / 2
+
+        self._bar_xs = []
+        self._bar_items = []
+        self._shimmer_items = []
+        for i in range(self.bar_count):
+            x = start_x + i * (self.bar_width + self.bar_gap)
+            self._bar_xs.append(x)
+            color = self.bar_colors[i % len(self.bar_colors)]
+            self._bar_items.append(
+                self.canvas.create_rectangle(
+                    x, mid_y, x + self.bar_width, mid_y, fill=color, outline="", tags="bars"
+                )
+            )
+            self._shimmer_items.append(
+                self.canvas.create_rectangle(
+                    x,
+                    mid_y,
+                    x,
+                    mid_y,
+                    fill=self._shimmer_colors[i % len(self._shimmer_colors)],
+                    outline="",
+                    state="hidden",
+                    tags="shimmer",
+                )
+            )
+
+        self._rec_item = self.canvas.create_oval(
+            8, mid_y - 4, 16, mid_y + 4, fill="#c84040", outline="", tags="rec"
+        )
+
+        # Reset the change-detection caches for the fresh window
+        self._last_bar_y = [None] * self.bar_count
+        self._last_shimmer = [None] * self.bar_count
+        self._last_rec_shade = None
+
+        # Cross-thread show/hide via virtual events. event_generate() is
+        # the documented thread-safe Tk IPC path; calling after() from a
+        # foreign thread is not guaranteed safe on all Tk builds.
+        self.root.bind("<<OverlayShow>>", lambda e: self._show_on_tk())
+        self.root.bind("<<OverlayHide>>", lambda e: self._hide_on_tk())
+
     def _draw_rounded_rect(self, x1: int, y1: int, x2: int, y2: int, radius: int, **kwargs) -> int:
         """Draw a rounded rectangle on the canvas.
 
@@ -274,7 +399,7 @@ class RecordingOverlay:
         ]
         return self.canvas.create_polygon(points, smooth=True, **kwargs)
 
-    def _animate(self) -> None:
+    def _animate(self, gen: int) -> None:
         """Animation loop entry point using thread-safe Tkinter after().
 
         This method is the entry point for the animation loop. It checks
@@ -289,6 +414,12 @@ class RecordingOverlay:
             - _draw_frame: Single frame rendering method
             - tk.TclError: Exception handling for destroyed windows
 
+        Args:
+            gen: Animation chain generation this callback belongs to.
+                Compared against _anim_gen so callbacks left over from a
+                superseded show/hide cycle exit instead of forking a
+                second concurrent animation chain.
+
         Returns:
             None: This method schedules itself to run repeatedly until
                 animation_running is False or the window is destroyed.
@@ -297,13 +428,26 @@ class RecordingOverlay:
             This method must only be called from the Tkinter thread as
             it directly accesses Tkinter widgets.
         """
+        if gen != self._anim_gen:
+            return  # Stale callback from a superseded animation chain
         if not self.animation_running or not self.root or not self.is_visible:
             return
 
         try:
-            self._draw_frame()
-            # Schedule next frame using after() - this is thread-safe
-            self.root.after(30, self._animate)  # ~30 FPS
+            # Only pay for drawing when the window can actually be seen;
+            # while unmapped, tick slowly so the loop notices when the
+            # window becomes viewable again.
+            if self.root.winfo_viewable():
+                # Deduct the time spent drawing from the frame interval so
+                # the animation cadence stays close to the target FPS even
+                # when a frame is slow, instead of drifting by draw-cost
+                start = time.perf_counter()
+                self._draw_frame()
+                elapsed_ms = int((time.perf_counter() - start) * 1000)
+                delay = max(1, self.active_delay_ms - elapsed_ms)
+            else:
+                delay = self.idle_delay_ms
+            self.root.after(delay, self._animate, gen)
         except tk.TclError:
             # Window was destroyed, stop animating
             pass
@@ -311,21 +455,20 @@ class RecordingOverlay:
     def _draw_frame(self) -> None:
         """Render a single animation frame of the waveform visualization.
 
-        Draws one complete frame of the animated waveform including:
+        Updates one complete frame of the animated waveform including:
         - Animated waveform bars with sine wave height modulation
         - Shimmer highlights that travel across the bars
         - A pulsing "REC" indicator dot
 
-        Clears previous frame elements (bars, shimmer, rec) before drawing
-        to create smooth animation. Uses phase counters to create organic
-        wave motion and shimmer effects.
+        All canvas items are created once in _create_window; this method
+        only repositions and recolors them. Moving existing items with
+        coords()/itemconfigure() avoids the per-frame allocation and
+        display-list churn of delete-and-recreate rendering.
 
         Key Technologies/APIs:
-            - tkinter.Canvas.delete: Remove previous frame elements by tag
-            - tkinter.Canvas.create_rectangle: Bar and shimmer drawing
-            - tkinter.Canvas.create_oval: REC indicator dot
-            - math.sin: Sine wave for organic animation curves
-            - Root.update_idletasks: Force immediate canvas redraw
+            - tkinter.Canvas.coords: Reposition existing canvas items
+            - tkinter.Canvas.itemconfigure: Recolor/show/hide items
+            - _fast_sin: Table-based sine for organic animation curves
 
         Returns:
             None
@@ -337,75 +480,142 @@ class RecordingOverlay:
         if not self.canvas:
             return
 
+        self.phase += 0.15
+        self.shimmer_phase += 0.08
+
+        # Hoist attribute lookups out of the per-bar loop; these run
+        # bar_count times per frame at 30 FPS
+        canvas = self.canvas
+        coords = canvas.coords
+        itemconfigure = canvas.itemconfigure
+        bar_xs = self._bar_xs
+        bar_items = self._bar_items
+        shimmer_items = self._shimmer_items
+        wave_offsets = self._wave_offsets
+        shimmer_offsets = self._shimmer_offsets
+        bar_width = self.bar_width
+        win_height = self.height
+        phase = self.phase
+        shimmer_phase = self.shimmer_phase
+        last_bar_y = self._last_bar_y
+        last_shimmer = self._last_shimmer
+
         try:
-            self.canvas.delete("bars")
-            self.canvas.delete("shimmer")
+            for i in range(self.bar_count):
+                # Calculate bar height with wave animation, quantized to
+                # whole pixels so sub-pixel wiggle doesn't force a redraw
+                wave = _fast_sin(phase + wave_offsets[i])
+                height = 12 + wave * 10
+
+                x = bar_xs[i]
+                y1 = int((win_height - height) / 2)
+                y2 = int(y1 + height)
+
+                if last_bar_y[i] != (y1, y2):
+                    last_bar_y[i] = (y1, y2)
+                    coords(bar_items[i], x, y1, x + bar_width, y2)
+
+                # Shimmer highlight travelling across the bar
+                shimmer_offset = (_fast_sin(shimmer_phase + shimmer_offsets[i]) + 1) / 2
+                shimmer_item = shimmer_items[i]
+                if 0.3 < shimmer_offset < 0.7:
+                    shimmer_width = 3
+                    shimmer_x = int(x + shimmer_offset * (bar_width - shimmer_width))
+                    state = (shimmer_x, y1, y2)
+                    if last_shimmer[i] != state:
+                        was_hidden = last_shimmer[i] is None
+                        last_shimmer[i] = state
+                        coords(shimmer_item, shimmer_x, y1 + 2, shimmer_x + shimmer_width, y2 - 2)
+                        if was_hidden:
+                            itemconfigure(shimmer_item, state="normal")
+                elif last_shimmer[i] is not None:
+                    last_shimmer[i] = None
+                    itemconfigure(shimmer_item, state="hidden")
+
+            # Pulse the "REC" indicator by recoloring the existing oval
+            pulse = (_fast_sin(phase * 0.5) + 1) / 2
+            red_shade = int(200 + pulse * 55)
+            if red_shade != self._last_rec_shade:
+                self._last_rec_shade = red_shade
+                itemconfigure(self._rec_item, fill=_REC_COLORS[red_shade - 200])
         except tk.TclError:
             return  # Canvas was destroyed
 
-        self.phase += 0.15
-        self.shimmer_phase += 0.08
+    def _tk_main(self) -> None:
+        """Entry point for the long-lived Tkinter thread.
 
-        total_width = (self.bar_width * self.bar_count) + (self.bar_gap * (self.bar_count - 1))
-        start_x = (self.width - total_width) / 2
+        Creates the overlay window once, signals readiness, performs the
+        initial show, and then runs mainloop() for the lifetime of the
+        process. Subsequent show()/hide() calls only map and unmap the
+        existing window via after()-scheduled callbacks, so the Tk
+        interpreter, canvas, and all canvas items are built exactly once.
 
-        for i in range(self.bar_count):
-            # Calculate bar height with wave animation
-            wave = math.sin(self.phase + i * 0.8)
-            height = 12 + wave * 10
+        Key Technologies/APIs:
+            - _create_window: One-time window and canvas construction
+            - threading.Event.set: Signals show()/hide() that root exists
+            - Tkinter.Tk.mainloop: Event loop running until process exit
 
-            x = start_x + i * (self.bar_width + self.bar_gap)
-            y1 = (self.height - height) / 2
-            y2 = y1 + height
+        Returns:
+            None
+        """
+        self._create_window()
+        self._tk_ready.set()
+        self.root.after(0, self._show_on_tk)
+        self.root.mainloop()
 
-            # Draw bar with gradient-like effect
-            color = self.bar_colors[i % len(self.bar_colors)]
-            self.canvas.create_rectangle(x, y1, x + self.bar_width, y2, fill=color, outline="", tags="bars")
+    def _show_on_tk(self) -> None:
+        """Map the overlay window and (re)start the animation loop.
 
-            # Add shimmer effect
-            shimmer_offset = (math.sin(self.shimmer_phase + i * 0.3) + 1) / 2
-            shimmer_width = 3
-            shimmer_x = x + shimmer_offset * (self.bar_width - shimmer_width)
+        Runs on the Tkinter thread. Re-asserts the borderless/topmost
+        attributes (some window managers drop them across withdraw/
+        deiconify cycles) before mapping the window.
 
-            # Create shimmer highlight
-            if shimmer_offset > 0.3 and shimmer_offset < 0.7:
-                self.canvas.create_rectangle(
-                    shimmer_x,
-                    y1 + 2,
-                    shimmer_x + shimmer_width,
-                    y2 - 2,
-                    fill="#ffffff",
-                    outline="",
-                    stipple="gray50",
-                    tags="shimmer",
-                )
+        Returns:
+            None
+        """
+        if not self.is_visible or not self.root:
+            return
+        try:
+            self.root.overrideredirect(True)
+            self.root.attributes("-topmost", True)
+            self.root.deiconify()
+        except tk.TclError:
+            return
+        # Starting a fresh generation invalidates any callback still
+        # queued from a previous chain, so double-starts are harmless
+        self._anim_gen += 1
+        self.animation_running = True
+        self.root.after(self.active_delay_ms, self._animate, self._anim_gen)
 
-        # Add "REC" indicator with pulsing effect
-        pulse = (math.sin(self.phase * 0.5) + 1) / 2
-        red_shade = int(200 + pulse * 55)
-        rec_color = f"#{red_shade:02x}4040"
+    def _hide_on_tk(self) -> None:
+        """Unmap the overlay window without destroying it.
 
-        self.canvas.delete("rec")
-        self.canvas.create_oval(
-            8, self.height / 2 - 4, 16, self.height / 2 + 4, fill=rec_color, outline="", tags="rec"
-        )
+        Runs on the Tkinter thread. withdraw() keeps the interpreter,
+        canvas, and items alive so the next show() is just a deiconify.
 
-        self.root.update_idletasks()
+        Returns:
+            None
+        """
+        if not self.root:
+            return
+        try:
+            self.root.withdraw()
+        except tk.TclError:
+            pass
 
     def show(self) -> None:
         """Display the overlay window and start the animation loop.
 
-        Creates the Tkinter window in a separate daemon thread and starts
-        the animation loop. The use of a separate thread allows the overlay
-        to run without blocking the main agent thread. Thread-safe state
-        management ensures multiple show() calls are handled gracefully.
+        On the first call, spawns the long-lived Tkinter daemon thread
+        which builds the window and shows it. On later calls, schedules a
+        deiconify on the existing window via after(), which is orders of
+        magnitude cheaper than rebuilding a Tk interpreter per recording.
 
         Key Technologies/APIs:
-            - threading.Lock: Thread-safe visibility state checking
-            - threading.Thread: Background Tkinter mainloop execution
-            - Tkinter.Tk.mainloop: Event loop for the overlay window
-            - _create_window: Window initialization on Tkinter thread
-            - _animate: Animation loop started via after()
+            - threading.Event: Lock-free visibility state checking
+            - threading.Thread: One-time Tkinter mainloop thread launch
+            - threading.Event.wait: Readiness gate for the root window
+            - Tk.event_generate <<OverlayShow>>: Thread-safe Tk signaling
             - daemon=True: Thread cleanup when main program exits
 
         Returns:
@@ -415,35 +625,34 @@ class RecordingOverlay:
             This method is thread-safe and can be called from any thread.
             If the overlay is already visible, the call has no effect.
         """
-        with self._lock:
-            if self.is_visible:
-                return
-            self.is_visible = True
+        if self._visible.is_set():
+            return
+        self._visible.set()
 
-        def _show_window():
-            self._create_window()
-            self.animation_running = True
-            # Start animation using after() - no separate thread needed
-            self.root.after(30, self._animate)
-            self.root.mainloop()
+        if self._tk_thread is None:
+            self._tk_thread = threading.Thread(target=self._tk_main, daemon=True)
+            self._tk_thread.start()
+            # _tk_main shows the window itself on first launch
+            return
 
-        # Run in a separate thread to not block
-        threading.Thread(target=_show_window, daemon=True).start()
+        if self._tk_ready.wait(timeout=2.0) and self.root:
+            try:
+                self.root.event_generate("<<OverlayShow>>", when="tail")
+            except tk.TclError:
+                pass
 
     def hide(self) -> None:
         """Hide the overlay window and stop the animation loop.
 
-        Marks the overlay as hidden and schedules window destruction
-        on the Tkinter thread via after(0, _destroy). This approach
-        ensures thread-safe cleanup from any calling thread without
-        causing cross-thread Tkinter access violations.
+        Marks the overlay as hidden and signals the Tkinter thread via a
+        <<OverlayHide>> virtual event. The window and its canvas items
+        are kept alive for the next recording; nothing is destroyed.
 
         Key Technologies/APIs:
-            - threading.Lock: Thread-safe visibility state updates
-            - Tkinter.Misc.after(0, callback): Immediate scheduling
-              of destruction on the Tkinter main thread
-            - Tk.quit/Tk.destroy: Graceful window teardown
-            - Exception handling for already-destroyed windows
+            - threading.Event: Lock-free visibility state updates
+            - Tk.event_generate <<OverlayHide>>: Thread-safe signaling
+              of the unmap to the Tkinter main thread
+            - Tk.withdraw: Unmaps the window, preserving all state
 
         Returns:
             None
@@ -451,32 +660,17 @@ class RecordingOverlay:
         Note:
             This method is thread-safe and can be called from any thread.
             If the overlay is already hidden, the call has no effect.
-            The actual window destruction is scheduled on the Tkinter
-            thread to prevent RuntimeError from cross-thread access.
         """
-        with self._lock:
-            if not self.is_visible:
-                return
-            self.is_visible = False
-            self.animation_running = False
+        if not self._visible.is_set():
+            return
+        self._visible.clear()
+        self.animation_running = False
 
         if self.root:
             try:
-                # Schedule destruction on the Tkinter thread
-                def _destroy():
-                    try:
-                        self.root.quit()
-                        self.root.destroy()
-                    except:
-                        pass
-                    self.root = None
-                    self.canvas = None
-
-                self.root.after(0, _destroy)
-            except:
-                # Root may already be destroyed
-                self.root = None
-                self.canvas = None
+                self.root.event_generate("<<OverlayHide>>", when="tail")
+            except tk.TclError:
+                pass
 
 
 # For testing standalone
@@ -6,7 +6,6 @@ a WebSocket connection. It just prints when hotkey is pressed/released.
 """
 
 import sys
-import time
 from unittest.mock import MagicMock
 
 # Mock the imports that might not be available
@@ -17,12 +16,23 @@ sys.modules['requests'] = MagicMock()
 sys.modules['dotenv'] = MagicMock()
 
 from pynput import keyboard
-from pynput.keyboard import GlobalHotKeys, Key
+from pynput.keyboard import Key
 
-# VK codes for tracking
-ALT_VK_CODES = {164, 165}  # Left Alt, Right Alt
+# VK codes for tracking. VK codes fit in 0..255, so pressed-key state is
+# a 256-bit integer bitmask: set/test/clear are single bitwise ops with
+# no hashing or allocation inside the hook callback.
+ALT_MASK = (1 << 164) | (1 << 165)  # Left Alt, Right Alt
 HOTKEY_VK = ord('L')  # 76
 
+# Modifier Key objects -> VK codes, hoisted to module scope so the
+# per-keystroke callbacks don't rebuild the dict on every event
+MODIFIER_VK_MAP = {
+    Key.alt_l: 164,
+    Key.alt_r: 165,
+    Key.alt: 164,
+    Key.alt_gr: 165,
+}
+
 print("=" * 60)
 print("Hotkey Test Script")
 print("=" * 60)
@@ -33,33 +43,23 @@ print("Press Ctrl+C to exit")
 print("=" * 60)
 
 # State
-pressed_vks = set()
+pressed_vks = 0  # bitmask of currently held VK codes
 hotkey_triggered = False
 is_recording = False
 
 def get_vk(key):
     """Extract VK code from key."""
-    modifier_vk_map = {
-        Key.alt_l: 164,
-        Key.alt_r: 165,
-        Key.alt: 164,
-        Key.alt_gr: 165,
-    }
-    if key in modifier_vk_map:
-        return modifier_vk_map[key]
-    if hasattr(key, "vk") and key.vk is not None:
-        return key.vk
-    if hasattr(key, "char") and key.char:
-        return ord(key.char.upper())
+    vk = MODIFIER_VK_MAP.get(key)
+    if vk is not None:
+        return vk
+    vk = getattr(key, "vk", None)
+    if vk is not None:
+        return vk
+    char = getattr(key, "char", None)
+    if char:
+        return ord(char.upper())
     return None
 
-# GlobalHotKeys for press detection
-hotkeys = {
-    "<alt_l>+l": lambda: on_hotkey_press(),
-    "<alt_r>+l": lambda: on_hotkey_press(),
-    "<alt_gr>+l": lambda: on_hotkey_press(),
-}
-
 def on_hotkey_press():
     """Called when hotkey is pressed."""
     global hotkey_triggered, is_recording
@@ -69,59 +69,65 @@ def on_hotkey_press():
         print("[HOTKEY] RECORDING STARTED!")
 
 def on_press(key):
-    """Track key presses."""
+    """Track key presses and detect the hotkey combo."""
+    global pressed_vks
     vk = get_vk(key)
     if vk is not None:
-        pressed_vks.add(vk)
-        # Suppress hotkey combinations
-        if pressed_vks & ALT_VK_CODES:  # Alt is pressed
-            if vk == HOTKEY_VK:
-                return False
+        pressed_vks |= 1 << vk
+        # Detect the hotkey combination inline; a separate
+        # GlobalHotKeys thread is not needed for detection. Always
+        # return True: returning False from a pynput callback does not
+        # suppress the event, it raises StopException and permanently
+        # stops the listener.
+        if pressed_vks & ALT_MASK and vk == HOTKEY_VK:
+            on_hotkey_press()
     return True
 
 def on_release(key):
     """Handle key releases."""
-    global hotkey_triggered, is_recording
-    
+    global pressed_vks, hotkey_triggered, is_recording
+
     vk = get_vk(key)
-    
+
     # Check if this is a hotkey-related release that should stop recording
     if hotkey_triggered and is_recording:
-        is_alt = vk in ALT_VK_CODES
+        is_alt = vk is not None and (1 << vk) & ALT_MASK
         is_hotkey_char = vk == HOTKEY_VK
-        
+
         if is_alt or is_hotkey_char:
             print("[HOTKEY] RECORDING STOPPED!")
             hotkey_triggered = False
             is_recording = False
             if vk is not None:
-                pressed_vks.discard(vk)
-            return False
-    
+                pressed_vks &= ~(1 << vk)
+            return True
+
     # Normal release - clean up
     if vk is not None:
-        pressed_vks.discard(vk)
-    
+        pressed_vks &= ~(1 << vk)
+
     # Reset hotkey triggered if we're no longer recording
     if hotkey_triggered and not is_recording:
         hotkey_triggered = False
-    
-    return True
 
-# Start listeners
-hotkey_listener = GlobalHotKeys(hotkeys)
-hotkey_listener.start()
+    return True
 
-release_listener = keyboard.Listener(on_press=on_press, on_release=on_release)
-release_listener.start()
+# Start a single listener: one hook thread handles both combo detection
+# and press/release bookkeeping, halving the OS callbacks and GIL
+# wakeups per keystroke compared to GlobalHotKeys + Listener.
+listener = keyboard.Listener(on_press=on_press, on_release=on_release)
+listener.start()
 
-print("\nListeners started. Hold Alt+L to test...")
+print("\nListener started. Hold Alt+L to test...")
 
+# Park the main thread with a timed join instead of a sleep(0.1) busy
+# loop. The 1s timeout matters: a bare join() is not interruptible by
+# Ctrl+C on Windows, so the main thread must resurface periodically
+# for KeyboardInterrupt to be delivered.
 try:
-    while True:
-        time.sleep(0.1)
+    while listener.running:
+        listener.join(1.0)
 except KeyboardInterrupt:
     print("\nStopping...")
-    hotkey_listener.stop()
-    release_listener.stop()
+    listener.stop()
     print("Done!")
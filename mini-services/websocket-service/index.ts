@@ -74,6 +74,18 @@ const ALLOWED_ORIGINS = (process.env.ALLOWED_ORIGINS || "http://localhost:3005,h
  */
 const STALE_TIMEOUT = parseInt(process.env.WS_STALE_TIMEOUT || "30000", 10);
 
+/**
+ * Maximum bytes of streamed PCM buffered per agent.
+ *
+ * Mirrors the agent's own recording cap: 300 seconds at 16kHz mono
+ * 16-bit is 9,600,000 bytes. `audio_chunk` deliberately bypasses the
+ * per-message rate limit and keeps refreshing lastActivity, so without
+ * this cap a stuck or hostile agent could grow the buffer until the
+ * service runs out of memory.
+ * Default: 9600000. Override with WS_MAX_STREAM_BYTES environment variable.
+ */
+const MAX_STREAM_BYTES = parseInt(process.env.WS_MAX_STREAM_BYTES || "9600000", 10);
+
 /**
  * Base URL for the Next.js API.
  * Used to forward audio for transcription/refinement.
@@ -96,6 +108,10 @@ interface AgentConnection {
   lastActivity: number;
   /** Unique agent identifier */
   agentId: string;
+  /** PCM chunks streamed during the current recording */
+  audioChunks: Buffer[];
+  /** Total bytes buffered in audioChunks (enforces MAX_STREAM_BYTES) */
+  audioBytes: number;
 }
 
 /**
@@ -106,14 +122,44 @@ interface AgentConnection {
 interface ProcessAudioMessage {
   /** Message type identifier */
   type: "process_audio";
-  /** Base64-encoded audio data */
-  audio: string;
+  /** Base64-encoded WAV audio data (legacy one-shot uploads) */
+  audio?: string;
+  /** Raw PCM payload sent as a binary attachment (modern agents) */
+  pcm?: Buffer;
+  /** PCM sample rate in Hz (only with pcm) */
+  sampleRate?: number;
+  /** Number of audio channels (only with pcm) */
+  channels?: number;
+  /** Refinement mode for text processing */
+  mode: "developer" | "concise" | "professional" | "raw" | "outline";
+  /** Where processing should occur */
+  processingMode?: "cloud" | "local";
+  /** Whether to translate non-English audio to English */
+  translate?: boolean;
+  /** Client timestamp */
+  timestamp: number;
+}
+
+/**
+ * End-of-utterance message for streamed audio.
+ *
+ * Agents that stream raw PCM via `audio_chunk` events send this when
+ * the hotkey is released; it carries the processing metadata that the
+ * one-shot `process_audio` message would otherwise include.
+ *
+ * @interface AudioEndMessage
+ */
+interface AudioEndMessage {
   /** Refinement mode for text processing */
   mode: "developer" | "concise" | "professional" | "raw" | "outline";
   /** Where processing should occur */
   processingMode?: "cloud" | "local";
   /** Whether to translate non-English audio to English */
   translate?: boolean;
+  /** PCM sample rate in Hz */
+  sampleRate?: number;
+  /** Number of audio channels */
+  channels?: number;
   /** Client timestamp */
   timestamp: number;
 }
@@ -259,6 +305,37 @@ function broadcastToUI(data: object) {
 // Audio Processing
 // ============================================
 
+/**
+ * Builds a 44-byte RIFF/WAVE header for 16-bit PCM data.
+ *
+ * Streamed recordings arrive as raw PCM chunks; the transcription API
+ * expects a WAV container, so the header is synthesized here before
+ * forwarding. This avoids any audio re-encoding on the agent side.
+ *
+ * @param dataLength - Length of the PCM payload in bytes
+ * @param sampleRate - Sample rate in Hz (default 16000)
+ * @param channels - Number of channels (default 1)
+ * @returns Buffer - The 44-byte WAV header
+ */
+function wavHeader(dataLength: number, sampleRate = 16000, channels = 1): Buffer {
+  const bytesPerSample = 2; // 16-bit PCM
+  const header = Buffer.alloc(44);
+  header.write("RIFF", 0, "ascii");
+  header.writeUInt32LE(36 + dataLength, 4);
+  header.write("WAVE", 8, "ascii");
+  header.write("fmt ", 12, "ascii");
+  header.writeUInt32LE(16, 16); // fmt chunk size
+  header.writeUInt16LE(1, 20); // PCM format
+  header.writeUInt16LE(channels, 22);
+  header.writeUInt32LE(sampleRate, 24);
+  header.writeUInt32LE(sampleRate * channels * bytesPerSample, 28); // byte rate
+  header.writeUInt16LE(channels * bytesPerSample, 32); // block align
+  header.writeUInt16LE(16, 34); // bits per sample
+  header.write("data", 36, "ascii");
+  header.writeUInt32LE(dataLength, 40);
+  return header;
+}
+
 /**
  * Processes audio through the transcription and refinement API.
  *
@@ -387,12 +464,16 @@ agentNamespace.on("connection", (socket: Socket) => {
     socket,
     lastActivity: Date.now(),
     agentId,
+    audioChunks: [],
+    audioBytes: 0,
   });
 
-  // Send confirmation
+  // Send confirmation (streaming: this server can assemble incremental
+  // PCM sent via audio_chunk/audio_end instead of one-shot WAV uploads)
   socket.emit("connection_confirmed", {
     type: "connection_confirmed",
     serverTime: Date.now(),
+    streaming: true,
   });
 
   // Send current settings if any
@@ -416,6 +497,8 @@ agentNamespace.on("connection", (socket: Socket) => {
     const agent = connectedAgents.get(agentId);
     if (agent) {
       agent.lastActivity = Date.now();
+      agent.audioChunks = []; // Fresh buffer for a streamed recording
+      agent.audioBytes = 0;
     }
 
     broadcastToUI({
@@ -426,6 +509,73 @@ agentNamespace.on("connection", (socket: Socket) => {
     console.log(`[WS] Agent ${agentId} started recording`);
   });
 
+  // Handle streamed PCM chunks (sent every ~100ms while recording)
+  socket.on("audio_chunk", (chunk: Buffer) => {
+    const agent = connectedAgents.get(agentId);
+    if (!agent) {
+      return;
+    }
+    agent.lastActivity = Date.now();
+
+    // Cap the buffered bytes: chunks bypass the per-message rate limit
+    // and refresh lastActivity, so the stale sweep never reclaims an
+    // agent that streams forever. Past the cap, drop the whole buffer -
+    // a recording longer than the agent-side maximum is malformed, and
+    // keeping a truncated prefix would just transcribe garbage.
+    if (agent.audioBytes + chunk.length > MAX_STREAM_BYTES) {
+      if (agent.audioBytes > 0) {
+        console.warn(`[WS] Agent ${agentId} exceeded ${MAX_STREAM_BYTES} buffered bytes; dropping stream`);
+      }
+      agent.audioChunks = [];
+      agent.audioBytes = 0;
+      return;
+    }
+
+    agent.audioChunks.push(Buffer.from(chunk));
+    agent.audioBytes += chunk.length;
+  });
+
+  // Handle end of a streamed recording: assemble the PCM chunks into a
+  // WAV and run the same processing pipeline as one-shot uploads.
+  socket.on("audio_end", async (meta: AudioEndMessage) => {
+    const agent = connectedAgents.get(agentId);
+    if (!agent || agent.audioChunks.length === 0) {
+      console.log(`[WS] audio_end from ${agentId} with no buffered chunks`);
+      return;
+    }
+
+    // Rate limit check (counted per utterance, not per chunk)
+    if (!checkRateLimit(agentId)) {
+      agent.audioChunks = [];
+      agent.audioBytes = 0;
+      socket.emit("dictation_result", {
+        type: "dictation_result",
+        success: false,
+        error: "Rate limit exceeded (max 30 per minute)",
+      });
+      return;
+    }
+
+    agent.lastActivity = Date.now();
+
+    const pcm = Buffer.concat(agent.audioChunks);
+    agent.audioChunks = [];
+    agent.audioBytes = 0;
+
+    const wav = Buffer.concat([wavHeader(pcm.length, meta.sampleRate, meta.channels), pcm]);
+
+    console.log(`[WS] Assembled streamed recording from ${agentId}: ${pcm.length} bytes PCM`);
+
+    await processAudio(socket, {
+      type: "process_audio",
+      audio: wav.toString("base64"),
+      mode: meta.mode,
+      processingMode: meta.processingMode,
+      translate: meta.translate,
+      timestamp: meta.timestamp,
+    });
+  });
+
   // Handle process audio
   socket.on("process_audio", async (message: ProcessAudioMessage) => {
     // Rate limit check
@@ -443,6 +593,16 @@ agentNamespace.on("connection", (socket: Socket) => {
       agent.lastActivity = Date.now();
     }
 
+    // Modern agents send raw PCM as a binary attachment; wrap it in a
+    // WAV container for the transcription API.
+    if (message.pcm) {
+      const pcm = Buffer.from(message.pcm);
+      message.audio = Buffer.concat([wavHeader(pcm.length, message.sampleRate, message.channels), pcm]).toString(
+        "base64"
+      );
+      delete message.pcm;
+    }
+
     await processAudio(socket, message);
   });
 